@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import random
+
 
 # Hier kannst du einstellen, ob Cooldowns von einem Kampf in den naechsten
 # übernommen werden.
@@ -21,6 +23,15 @@ MISSION_COOLDOWN_CARRYOVER: dict[str, bool] = {
 }
 
 
+# Wie viele Missionen ein Spieler pro Tag (Europe/Berlin) starten darf.
+DAILY_MISSION_LIMIT = 2
+
+
+# Denkpause des Gegners in Missionen (Sekunden, zufällig zwischen min und max),
+# während seine Karte groß angezeigt wird. (0, 0) schaltet die Pause ab.
+MISSION_BOT_TURN_DELAY_SECONDS: tuple[float, float] = (2.0, 5.0)
+
+
 def should_carry_cooldowns(mode: str) -> bool:
     key = str(mode or "").strip().lower()
     aliases = {
@@ -34,3 +45,11 @@ def should_carry_cooldowns(mode: str) -> bool:
 
 def should_carry_mission_cooldowns(*, is_boss_wave: bool) -> bool:
     return bool(MISSION_COOLDOWN_CARRYOVER.get("boss" if is_boss_wave else "lackeys", False))
+
+
+def mission_bot_turn_delay() -> float:
+    low, high = MISSION_BOT_TURN_DELAY_SECONDS
+    low, high = max(0.0, float(low)), max(0.0, float(high))
+    if high <= 0:
+        return 0.0
+    return random.uniform(min(low, high), high)
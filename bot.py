@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
 import json
 import logging
 import aiosqlite
@@ -53,6 +54,7 @@ from botcore.ui_common import (
     ShowAllMembersPager,
 )
 from db import DB_PATH, close_db, db_context, init_db
+from services.db import db_read_context
 from karten import (
     DIRECT_DAMAGE_CAP,
     SPECIAL_DAMAGE_UPGRADE_MAX_TIMES,
@@ -62,7 +64,12 @@ from karten import (
     DOT_TYPE_DEFAULTS,
     karten as RAW_KARTEN,
 )
-from battle_flow_config import should_carry_cooldowns, should_carry_mission_cooldowns
+from battle_flow_config import (
+    DAILY_MISSION_LIMIT,
+    mission_bot_turn_delay,
+    should_carry_cooldowns,
+    should_carry_mission_cooldowns,
+)
 import game_ui_texts
 from mission_enemies import (
     get_operation_broken_timeline_encounters,
@@ -126,6 +133,7 @@ from services.card_variants import (
     base_card_name,
     build_runtime_card,
     card_has_multiple_variants,
+    cards_version,
     default_variant_name_for_base,
     exact_variant_names_with_amounts,
     group_owned_cards_by_base,
@@ -205,10 +213,12 @@ from services.user_data import (
     add_card_buff,
     add_infinitydust as _add_infinitydust,
     add_karte,
-    add_karte_amount,
+    add_karten_amounts,
     add_mission_reward,
     add_units,
     check_and_add_karte,
+    claim_daily_reward,
+    claim_mission_slot,
     delete_user_data,
     get_card_buffs,
     get_infinitydust,
@@ -218,7 +228,6 @@ from services.user_data import (
     get_team,
     get_user_karten,
     has_exact_card_variant,
-    increment_mission_count,
     log_admin_dust_action,
     remove_invalid_damage_card_buffs,
     remove_infinitydust,
@@ -477,11 +486,13 @@ def _member_has_role(member: discord.Member, role_id: int) -> bool:
 
 
 def _get_fight_opponent_candidates(guild: discord.Guild, challenger: discord.Member) -> list[discord.Member]:
-    return [
-        member
-        for member in guild.members
-        if not member.bot and member != challenger and _member_has_role(member, FIGHT_OPPONENT_ROLE_ID)
-    ]
+    # Über die Rolle statt über alle Member: role.members prüft nur die Rollen-IDs,
+    # member.roles baut dagegen pro Member eine sortierte Rollenliste.
+    role = guild.get_role(FIGHT_OPPONENT_ROLE_ID)
+    if role is None:
+        return []
+    challenger_id = challenger.id
+    return [member for member in role.members if not member.bot and member.id != challenger_id]
 
 
 def _resolve_member_status(member: discord.Member) -> discord.Status:
@@ -3066,9 +3077,11 @@ async def is_channel_allowed_ids(
 ) -> bool:
     if not guild_id or not channel_id:
         return False
-    async with db_context() as db:
-        cursor = await db.execute("SELECT channel_id FROM guild_allowed_channels WHERE guild_id = ?", (guild_id,))
-        allowed_channels = {r[0] for r in await cursor.fetchall()}
+    # Läuft bei jeder Nachricht/Interaktion: reine Lese-Query, also über eine
+    # Lese-Verbindung statt hinter der Schreib-Verbindung anzustehen.
+    async with db_read_context() as db:
+        rows = await db.execute_fetchall("SELECT channel_id FROM guild_allowed_channels WHERE guild_id = ?", (guild_id,))
+        allowed_channels = {r[0] for r in rows}
     if not allowed_channels:
         return False
     if channel_id in allowed_channels:
@@ -3498,7 +3511,8 @@ class ZieheKarteView(RestrictedView):
             color=_card_rarity_color(karte),
         )
         embed.set_image(url=karte["bild"])
-        await interaction.response.send_message(embed=embed, view=ZieheKarteView(self.user_id))
+        # Dieselbe View weiterverwenden; discord.py verlängert das Timeout bei jeder Interaktion.
+        await interaction.response.send_message(embed=embed, view=self)
 
 # View für Missions-Buttons
 class MissionView(RestrictedView):
@@ -3520,7 +3534,7 @@ class MissionView(RestrictedView):
                 color=_card_rarity_color(karte),
             )
             embed.set_image(url=karte["bild"])
-            await interaction.response.send_message(embed=embed, view=MissionView(self.user_id))
+            await interaction.response.send_message(embed=embed, view=self)
         else:
             # Karte wurde zu Infinitydust umgewandelt
             # Req. 7.3/7.8: bereits besessene Karte gibt den konfigurierten Bonus-Staub (sofort).
@@ -3539,11 +3553,22 @@ class MissionView(RestrictedView):
 
 # View für HP-Button (über der Karte)
 class HPView(RestrictedView):
+    # Nur 6 mögliche Anzeigen (hp // 20 ∈ 0..5) – einmal vorberechnet statt pro Angriff.
+    _HP_BARS = tuple("❤️" * i + "🖤" * (5 - i) for i in range(6))
+
     def __init__(self, player_card, player_hp):
         super().__init__(timeout=120)
         self.player_card = player_card
         self.player_hp = player_hp
-        self.hp_hearts = "❤️" * (self.player_hp // 20) + "🖤" * (5 - self.player_hp // 20)
+        self.hp_hearts = self._hearts_for(self.player_hp)
+        self._hp_button = self.hp_display
+
+    @classmethod
+    def _hearts_for(cls, hp: int) -> str:
+        steps = hp // 20
+        if 0 <= steps < len(cls._HP_BARS):
+            return cls._HP_BARS[steps]
+        return "❤️" * steps + "🖤" * (5 - steps)
 
     @ui.button(label="❤️❤️❤️❤️❤️", style=discord.ButtonStyle.success)
     async def hp_display(self, interaction: discord.Interaction, button: ui.Button):
@@ -3553,11 +3578,8 @@ class HPView(RestrictedView):
     def update_hp(self, new_hp):
         """Aktualisiert die HP-Anzeige"""
         self.player_hp = new_hp
-        self.hp_hearts = "❤️" * (self.player_hp // 20) + "🖤" * (5 - self.player_hp // 20)
-        for child in self.children:
-            if isinstance(child, ui.Button):
-                child.label = self.hp_hearts
-                break
+        self.hp_hearts = self._hearts_for(self.player_hp)
+        self._hp_button.label = self.hp_hearts
 
 # View für Kampf-Buttons (unter der Karte)
 class BattleMechanicsMixin:
@@ -3988,8 +4010,24 @@ class BaseBattleView(BattleMechanicsMixin, DurableView):
         self.last_special_attack = runtime_maps["last_special_attack"]
         self._last_damage_roll_meta: dict | None = None
         self._optional_attack_confirmations: dict[int, dict[str, object]] = {}
+        self._attack_button_parts_cache: dict[tuple[int, int], tuple[dict, str, discord.ButtonStyle]] = {}
         return runtime_maps
 
+    def _attack_button_parts(self, attack: dict, max_only_bonus: int) -> tuple[str, discord.ButtonStyle]:
+        """Button-Label (inkl. CD-Suffix) und Stil einer Attacke, pro Kampf gecacht.
+
+        Die Attacken-Dicts sind Laufzeit-Kopien und ändern sich im Kampf nicht;
+        der Treffer zählt nur, wenn es noch dasselbe Dict ist (Kartenwechsel).
+        """
+        key = (id(attack), int(max_only_bonus))
+        cached = self._attack_button_parts_cache.get(key)
+        if cached is not None and cached[0] is attack:
+            return cached[1], cached[2]
+        display_label, display_style, _ = _attack_display_parts(attack, max_only_bonus=max_only_bonus)
+        label = _attack_label_with_cd(display_label, attack)
+        self._attack_button_parts_cache[key] = (attack, label, display_style)
+        return label, display_style
+
     def setze_gegner_version(self, version: dict | None, guild_id: int | None = None) -> None:
         """Legt fest, mit welcher Gegner-Version der Bot diesen Kampf spielt.
 
@@ -4053,6 +4091,9 @@ class BattleView(BaseBattleView):
         self.round_counter = 0
         self._last_log_edit_ts = 0.0
         self.ui_needs_resend = False
+        # Damage-Buffs je (Spieler, Karte) -> {Angriffsnummer: Bonus}; einmal geladen,
+        # damit Buttons und Angriffe pro Zug keine DB-Abfrage brauchen.
+        self._damage_buffs: dict[tuple[int, str], dict[int, int]] = {}
         # Effekt-/Modifier-Maps + _last_damage_roll_meta/_optional_attack_confirmations
         # werden bereits oben von _init_battle_runtime_maps() gesetzt.
 
@@ -5070,11 +5111,23 @@ class BattleView(BaseBattleView):
     def reduce_cooldowns(self, player_id):
         battle_state.reduce_cooldowns(self.attack_cooldowns[player_id])
 
+    async def _damage_buff_map(self, player_id: int, card_name: str) -> dict[int, int]:
+        key = (player_id, card_name)
+        damage_map = self._damage_buffs.get(key)
+        if damage_map is None:
+            _health, damage_map = battle_state.summarize_card_buffs(await get_card_buffs(player_id, card_name))
+            self._damage_buffs[key] = damage_map
+        return damage_map
+
     async def init_with_buffs(self):
-        player1_buffs = await get_card_buffs(self.player1_id, self.player1_card["name"])
-        player2_buffs = await get_card_buffs(self.player2_id, self.player2_card["name"])
-        health_buff1, _damage_map1 = battle_state.summarize_card_buffs(player1_buffs)
-        health_buff2, _damage_map2 = battle_state.summarize_card_buffs(player2_buffs)
+        player1_buffs, player2_buffs = await asyncio.gather(
+            get_card_buffs(self.player1_id, self.player1_card["name"]),
+            get_card_buffs(self.player2_id, self.player2_card["name"]),
+        )
+        health_buff1, damage_map1 = battle_state.summarize_card_buffs(player1_buffs)
+        health_buff2, damage_map2 = battle_state.summarize_card_buffs(player2_buffs)
+        self._damage_buffs[(self.player1_id, self.player1_card["name"])] = damage_map1
+        self._damage_buffs[(self.player2_id, self.player2_card["name"])] = damage_map2
         self.player1_hp += health_buff1
         self.player2_hp += health_buff2
         self.player1_max_hp = self.player1_hp
@@ -5106,7 +5159,7 @@ class BattleView(BaseBattleView):
         standard_idx = _standard_attack_index(attacks)
 
         # Hole Buffs für diese Karte
-        card_buffs = await get_card_buffs(self.current_turn, current_card["name"])
+        damage_buffs = await self._damage_buff_map(self.current_turn, current_card["name"])
 
         # Finde die vier Angriffs-Buttons (Zeilen 0 und 1, unabhängig von Label/Style)
         attack_buttons = [child for child in self.children if isinstance(child, ui.Button) and child.row in (0, 1)]
@@ -5153,14 +5206,8 @@ class BattleView(BaseBattleView):
                     continue
                 attack = attacks[i]
                 if i == standard_idx:
-                    damage_max_bonus = 0
-                    for buff_type, attack_number, buff_amount in card_buffs:
-                        if buff_type == "damage" and attack_number == (i + 1):
-                            damage_max_bonus += buff_amount
-                    display_label, display_style, _ = _attack_display_parts(
-                        attack,
-                        max_only_bonus=damage_max_bonus,
-                    )
+                    damage_max_bonus = damage_buffs.get(i + 1, 0)
+                    button_label, display_style = self._attack_button_parts(attack, damage_max_bonus)
                     is_on_cooldown = self.is_attack_on_cooldown(self.current_turn, i)
                     is_reload_action = bool(attack.get("requires_reload") and self.is_reload_needed(self.current_turn, i))
                     if is_on_cooldown:
@@ -5173,7 +5220,7 @@ class BattleView(BaseBattleView):
                             button.label = str(attack.get("reload_name") or "Nachladen")
                         else:
                             button.style = display_style
-                            button.label = _attack_label_with_cd(display_label, attack)
+                            button.label = button_label
                         button.disabled = False
                     continue
                 attack_name = str(attack.get("name") or f"Angriff {i+1}")
@@ -5188,14 +5235,8 @@ class BattleView(BaseBattleView):
         for i, attack in enumerate(attacks[:4]):
             if i < len(attack_buttons):
                 button = attack_buttons[i]
-                damage_max_bonus = 0
-                for buff_type, attack_number, buff_amount in card_buffs:
-                    if buff_type == "damage" and attack_number == (i + 1):
-                        damage_max_bonus += buff_amount
-                display_label, display_style, _ = _attack_display_parts(
-                    attack,
-                    max_only_bonus=damage_max_bonus,
-                )
+                damage_max_bonus = damage_buffs.get(i + 1, 0)
+                button_label, display_style = self._attack_button_parts(attack, damage_max_bonus)
                 is_on_cooldown = self.is_attack_on_cooldown(self.current_turn, i)
                 is_reload_action = bool(attack.get("requires_reload") and self.is_reload_needed(self.current_turn, i))
                 if is_on_cooldown:
@@ -5209,7 +5250,7 @@ class BattleView(BaseBattleView):
                     button.disabled = False
                 else:
                     button.style = display_style
-                    button.label = _attack_label_with_cd(display_label, attack)
+                    button.label = button_label
                     button.disabled = False
 
         # Deaktiviere restliche Buttons, falls die aktuelle Karte weniger als 4 Attacken hat
@@ -5429,11 +5470,9 @@ class BattleView(BaseBattleView):
             is_reload_action = bool(attack.get("requires_reload") and self.is_reload_needed(self.current_turn, attack_index))
             attack_name = str(attack.get("reload_name") or "Nachladen") if is_reload_action else attack["name"]
 
-            # NEUES BUFF-SYSTEM: Hole User-spezifische Damage-Buffs
-            card_buffs = await get_card_buffs(self.current_turn, current_card["name"])
-            for buff_type, attack_number, buff_amount in card_buffs:
-                if buff_type == "damage" and attack_number == (attack_index + 1):
-                    damage_max_bonus += buff_amount
+            # NEUES BUFF-SYSTEM: User-spezifische Damage-Buffs (einmal pro Kampf geladen)
+            damage_buffs = await self._damage_buff_map(self.current_turn, current_card["name"])
+            damage_max_bonus += damage_buffs.get(attack_index + 1, 0)
 
         attack_effect_types = {
             str(effect.get("type") or "").strip().lower()
@@ -7894,7 +7933,7 @@ class OpponentSelectView(RestrictedView):
         else:
             # Größere Liste: Suche zuerst, dann Bot, dann häufig sichtbare Nutzer und Vollansicht
             online_like = [m for m in self.all_members if m.status != discord.Status.offline]
-            for member in sorted(online_like, key=_member_presence_priority)[:22]:
+            for member in heapq.nsmallest(22, online_like, key=_member_presence_priority):
                 options.append(SelectOption(label=label_with_circle(member), value=str(member.id)))
             options.append(SelectOption(label="📋 Alle User anzeigen", value="show_all"))
 
@@ -8059,11 +8098,12 @@ class AdminUserSelectView(RestrictedView):
 
     def show_smart_options(self):
         options: list[SelectOption] = []
-        members_sorted = sorted(self.all_members, key=_member_presence_priority)
+        # Angezeigt werden höchstens 24 Nutzer; kein Komplett-Sort über die ganze Gilde.
+        members_sorted = heapq.nsmallest(24, self.all_members, key=_member_presence_priority)
 
         if not members_sorted:
             options.append(SelectOption(label="Keine Nutzer verfügbar", value="none"))
-        elif len(members_sorted) <= 24:
+        elif len(self.all_members) <= 24:
             # Bis 24 User: alle anzeigen + Suchoption (max. 25 Optionen)
             for member in members_sorted:
                 circle = _member_status_circle(member)
@@ -8549,13 +8589,18 @@ async def _start_fight_card_selection_from_challenge(
     if interaction.guild is None:
         await interaction.followup.send(SERVER_ONLY, ephemeral=True)
         return
-    send_channel = await _resolve_thread_channel_or_fallback(thread_id, interaction.channel)
+    # Thread, beide Mitglieder und die Karten des Herausgeforderten sind
+    # unabhängig voneinander: gleichzeitig holen statt vier Wartezeiten am Stück.
+    send_channel, challenger, challenged, challenged_karten = await asyncio.gather(
+        _resolve_thread_channel_or_fallback(thread_id, interaction.channel),
+        _get_member_safe(interaction.guild, challenger_id),
+        _get_member_safe(interaction.guild, challenged_id),
+        get_user_karten(challenged_id),
+    )
     if thread_id and _thread_id_for_channel(send_channel) != thread_id:
         await interaction.followup.send("❌ Der private Kampf-Thread ist nicht mehr verfügbar. Bitte erneut herausfordern.", ephemeral=True)
         await _maybe_delete_fight_thread(thread_id, thread_created)
         return
-    challenger = await _get_member_safe(interaction.guild, challenger_id)
-    challenged = await _get_member_safe(interaction.guild, challenged_id)
     if not challenger or not challenged:
         await interaction.followup.send("❌ Nutzer nicht gefunden. Bitte erneut herausfordern.", ephemeral=True)
         await _maybe_delete_fight_thread(thread_id, thread_created)
@@ -8569,9 +8614,7 @@ async def _start_fight_card_selection_from_challenge(
         )
         await _maybe_delete_fight_thread(thread_id, thread_created)
         return
-    gegner_karten_liste = _sort_user_cards_like_karten(
-        _filter_owned_cards_for_current_mode(await get_user_karten(challenged.id))
-    )
+    gegner_karten_liste = _sort_user_cards_like_karten(_filter_owned_cards_for_current_mode(challenged_karten))
     if not gegner_karten_liste:
         await _safe_send_channel(
             interaction,
@@ -8846,7 +8889,14 @@ async def _start_mission_wave_in_thread(
     total_waves = max(wave_num, len(encounters), int(mission_state.get("total_waves", mission_data.get("waves", 1)) or 1))
     mission_data["waves"] = total_waves
     if wave_num == 1 and not bool(mission_state.get("mission_counted")) and not bool(mission_state.get("is_admin", False)):
-        await increment_mission_count(interaction.user.id)
+        # /mission prüft das Limit nur vorab; hier wird der Platz atomar belegt.
+        if await claim_mission_slot(interaction.user.id) is None:
+            await _safe_send_channel(
+                interaction,
+                interaction.channel,
+                content=f"❌ Du hast heute bereits deine {DAILY_MISSION_LIMIT} Missionen aufgebraucht! Komme morgen wieder.",
+            )
+            return None
         mission_state["mission_counted"] = True
         mission_data["mission_counted"] = True
     mission_enemy = _mission_encounter_for_wave(mission_data, wave_num)
@@ -9819,21 +9869,27 @@ class FuseFlowModal(RestrictedModal):
         return True
 
 
+# Statische Dust-Stufen (Mindestguthaben, Option); nur die Auswahl hängt vom
+# Guthaben ab.
+_DUST_AMOUNT_TIERS: tuple[tuple[int, SelectOption], ...] = (
+    (
+        FUSE_DUST_COST,
+        SelectOption(
+            label=f"{FUSE_DUST_COST} Infinitydust verwenden",
+            value=str(FUSE_DUST_COST),
+            description=(
+                f"Leben +{FUSE_HEALTH_BONUS} oder Schaden: "
+                f"Std +{STANDARD_DAMAGE_UPGRADE_STEP} / Spez +{SPECIAL_DAMAGE_UPGRADE_STEP}"
+            ),
+            emoji="💎",
+        ),
+    ),
+)
+
+
 class DustAmountSelect(ui.Select):
     def __init__(self, user_dust):
-        options = []
-        if user_dust >= FUSE_DUST_COST:
-            options.append(
-                SelectOption(
-                    label=f"{FUSE_DUST_COST} Infinitydust verwenden",
-                    value=str(FUSE_DUST_COST),
-                    description=(
-                        f"Leben +{FUSE_HEALTH_BONUS} oder Schaden: "
-                        f"Std +{STANDARD_DAMAGE_UPGRADE_STEP} / Spez +{SPECIAL_DAMAGE_UPGRADE_STEP}"
-                    ),
-                    emoji="💎",
-                )
-            )
+        options = [option for threshold, option in _DUST_AMOUNT_TIERS if user_dust >= threshold]
         super().__init__(placeholder="Wähle die Infinitydust-Menge...", options=options)
 
     async def callback(self, interaction: discord.Interaction):
@@ -10001,6 +10057,9 @@ class FuseCardSelectView(FuseFlowView):
         self.search_query = str(search_query or "").strip()
         self.grouped_cards = list(grouped_cards) if grouped_cards is not None else _group_owned_cards_for_current_mode(list(self.user_karten))
         self.page = max(0, int(page))
+        # Optionen pro Seite; grouped_cards bleibt für die View fest, also
+        # müssen Blättern und _render() eine Seite nur einmal aufbauen.
+        self._card_options_by_page: dict[int, list[SelectOption]] = {}
 
         self.action_select = FuseCardActionSelect(self)
         self.card_select = CardSelect(self)
@@ -10066,16 +10125,21 @@ class FuseCardSelectView(FuseFlowView):
         return "Wähle eine Karte zum Verstärken..."
 
     def card_options(self) -> list[SelectOption]:
-        visible_groups = self._visible_groups()
-        if not visible_groups:
-            return [SelectOption(label="Keine Karten verfügbar", value=FUSE_CARD_EMPTY)]
-        return [
-            SelectOption(
-                label=_group_option_label(group)[:100],
-                value=str(group.get("base_name") or ""),
-            )
-            for group in visible_groups
-        ]
+        options = self._card_options_by_page.get(self.page)
+        if options is None:
+            visible_groups = self._visible_groups()
+            if not visible_groups:
+                options = [SelectOption(label="Keine Karten verfügbar", value=FUSE_CARD_EMPTY)]
+            else:
+                options = [
+                    SelectOption(
+                        label=_group_option_label(group)[:100],
+                        value=str(group.get("base_name") or ""),
+                    )
+                    for group in visible_groups
+                ]
+            self._card_options_by_page[self.page] = options
+        return list(options)
 
     def build_embed(self) -> discord.Embed:
         if self.mode == "browse":
@@ -10175,6 +10239,7 @@ class FuseCardSelectView(FuseFlowView):
             selected_card,
             karte_data,
             user_buffs,
+            user_karten=self.user_karten,
         )
         self.stop()
         await edit_interaction_message(
@@ -10199,18 +10264,22 @@ class FuseCardSelectView(FuseFlowView):
 
 
 class BuffTypeSelectView(FuseFlowView):
-    def __init__(self, requester_id, dust_amount, selected_card, karte_data, user_buffs):
+    def __init__(self, requester_id, dust_amount, selected_card, karte_data, user_buffs, *, user_karten=None):
         super().__init__(requester_id, timeout=600)
         self.dust_amount = int(dust_amount)
         self.selected_card = selected_card
-        self.add_item(BuffTypeSelect(self.dust_amount, selected_card, karte_data, user_buffs))
+        self.add_item(BuffTypeSelect(self.dust_amount, selected_card, karte_data, user_buffs, user_karten=user_karten))
         self.add_item(FuseCancelButton())
 
 
 class BuffTypeSelect(ui.Select):
-    def __init__(self, dust_amount, selected_card, karte_data, user_buffs):
+    def __init__(self, dust_amount, selected_card, karte_data, user_buffs, *, user_karten=None):
         self.dust_amount = dust_amount
         self.selected_card = selected_card
+        self.karte_data = karte_data
+        # Kartenliste aus der Held-Auswahl; "Held wechseln" braucht sie nicht
+        # erneut aus der DB (Verstärken ändert den Kartenbesitz nicht).
+        self.user_karten = list(user_karten) if user_karten is not None else None
         total_health, damage_map = battle_state.summarize_card_buffs(user_buffs)
         base_hp = int(karte_data.get("hp", 100) or 100)
         current_hp = base_hp + total_health
@@ -10258,7 +10327,7 @@ class BuffTypeSelect(ui.Select):
         await defer_interaction(interaction, ephemeral=True)
         buff_choice = str(self.values[0] or "")
         if buff_choice == "change_card":
-            user_karten = await get_user_karten(interaction.user.id)
+            user_karten = self.user_karten if self.user_karten is not None else await get_user_karten(interaction.user.id)
             if not user_karten:
                 await send_interaction_response(interaction, content="❌ Du hast keine Karten zum Verstärken!", ephemeral=True)
                 return
@@ -10271,12 +10340,13 @@ class BuffTypeSelect(ui.Select):
         # v2.3.10: Nach der Stat-Auswahl NICHT mehr sofort 1× anwenden, sondern zur
         # Multiplikator-Auswahl (1×–6×) weiterleiten. So kann man in EINEM Schritt
         # mehrfach verstärken (z. B. 2× = 10 Dust → +2 Schritte) statt pro Klick nur +1.
-        karte_data = await get_karte_by_name(self.selected_card)
-        if not karte_data:
-            await send_interaction_response(interaction, content="❌ Karte nicht gefunden!", ephemeral=True)
-            return
-        user_buffs = await get_card_buffs(interaction.user.id, self.selected_card)
-        user_dust = await get_infinitydust(interaction.user.id)
+        # Die Karte hat schon die Held-Auswahl aufgelöst; Buffs und Dust dagegen
+        # frisch lesen, sie können sich seitdem geändert haben.
+        karte_data = self.karte_data
+        user_buffs, user_dust = await asyncio.gather(
+            get_card_buffs(interaction.user.id, self.selected_card),
+            get_infinitydust(interaction.user.id),
+        )
         requester_id = self.view.requester_id if self.view is not None else interaction.user.id
         next_view = FuseMultiplierView(
             requester_id,
@@ -11483,102 +11553,6 @@ class BetaConfirmView(RestrictedView):
             return
         await interaction.response.edit_message(content=game_ui_texts.BETA_CANCELLED, view=None, embed=None)
 
-class UserSelectView(RestrictedView):
-    def __init__(self, user_id, guild):
-        super().__init__(timeout=60)
-        self.user_id = user_id
-        self.guild = guild
-        self.value = None
-        self.members = sorted(
-            [member for member in guild.members if not member.bot],
-            key=lambda m: safe_display_name(m, fallback="Unbekannt").lower(),
-        )
-        self.pages = [self.members[i:i + 24] for i in range(0, len(self.members), 24)] or [[]]
-        self.page_index = 0
-
-        self.select = ui.Select(
-            placeholder=self._placeholder(),
-            min_values=1,
-            max_values=1,
-            options=self._build_options_for_current_page(),
-            row=0,
-        )
-        self.select.callback = self.select_callback
-        self.add_item(self.select)
-
-        self.prev_btn = ui.Button(label="Zurück", style=discord.ButtonStyle.secondary, disabled=True, row=1)
-        self.next_btn = ui.Button(
-            label="Weiter",
-            style=discord.ButtonStyle.secondary,
-            disabled=(len(self.pages) <= 1),
-            row=1,
-        )
-        self.prev_btn.callback = self._on_prev
-        self.next_btn.callback = self._on_next
-        self.add_item(self.prev_btn)
-        self.add_item(self.next_btn)
-
-    def _placeholder(self) -> str:
-        if not self.members:
-            return "Wähle einen Nutzer oder suche oben..."
-        return f"Wähle einen Nutzer... (Seite {self.page_index + 1}/{len(self.pages)})"
-
-    def _build_options_for_current_page(self) -> list[SelectOption]:
-        options = [SelectOption(label="🔍 Nach Name suchen", value="search")]
-        if not self.members:
-            options.append(SelectOption(label="Keine Nutzer verfügbar", value="__none__"))
-            return options
-        page_members = self.pages[self.page_index]
-        for member in page_members:
-            options.append(SelectOption(label=safe_user_option_label(member), value=str(member.id)))
-        return options
-
-    async def select_callback(self, interaction: discord.Interaction):
-        if interaction.user.id != self.user_id:
-            await interaction.response.send_message("Nur der Command-User kann den Nutzer wählen!", ephemeral=True)
-            return
-        selected_value = self.select.values[0]
-        if selected_value == "search":
-            modal = UserSearchModal(
-                self.guild,
-                interaction.user,
-                parent_view=self,
-                include_bot_option=False,
-                exclude_user_id=None,
-            )
-            await interaction.response.send_modal(modal)
-            return
-        if selected_value == "__none__":
-            await interaction.response.send_message("❌ Keine Nutzer verfügbar.", ephemeral=True)
-            return
-        self.value = selected_value
-        self.stop()
-        await interaction.response.defer()
-
-    async def _on_prev(self, interaction: discord.Interaction):
-        if interaction.user.id != self.user_id:
-            await interaction.response.send_message("Nicht dein Menü!", ephemeral=True)
-            return
-        if self.page_index > 0:
-            self.page_index -= 1
-            self.select.options = self._build_options_for_current_page()
-            self.select.placeholder = self._placeholder()
-            self.prev_btn.disabled = (self.page_index == 0)
-            self.next_btn.disabled = (self.page_index == len(self.pages) - 1)
-        await interaction.response.edit_message(view=self)
-
-    async def _on_next(self, interaction: discord.Interaction):
-        if interaction.user.id != self.user_id:
-            await interaction.response.send_message("Nicht dein Menü!", ephemeral=True)
-            return
-        if self.page_index < len(self.pages) - 1:
-            self.page_index += 1
-            self.select.options = self._build_options_for_current_page()
-            self.select.placeholder = self._placeholder()
-            self.prev_btn.disabled = (self.page_index == 0)
-            self.next_btn.disabled = (self.page_index == len(self.pages) - 1)
-        await interaction.response.edit_message(view=self)
-
 async def _build_owned_card_detail(
     *,
     user_id: int,
@@ -11774,16 +11748,34 @@ class VaultView(RestrictedView):
 
         await send_page(interaction, current_index)
 
+
+_GIVE_CARD_PAGES_CACHE: dict[int, list[list[SelectOption]]] = {}
+
+
+def _give_card_option_pages() -> list[list[SelectOption]]:
+    """Seiten (je 25) für GiveCardSelectView: alle Karten aus karten.py + Infinitydust.
+
+    Die Optionen werden nur neu gebaut, wenn sich die Karten geändert haben
+    (cards_version, erhöht von card_store.anwenden).
+    """
+    version = cards_version()
+    pages = _GIVE_CARD_PAGES_CACHE.get(version)
+    if pages is None:
+        options = [SelectOption(label=str(karte["name"]), value=str(karte["name"])) for karte in karten]
+        options.append(SelectOption(label="💎 Infinitydust", value="infinitydust"))
+        pages = [options[i:i + 25] for i in range(0, len(options), 25)] or [[]]
+        _GIVE_CARD_PAGES_CACHE.clear()
+        _GIVE_CARD_PAGES_CACHE[version] = pages
+    return pages
+
+
 class GiveCardSelectView(RestrictedView):
     def __init__(self, user_id, target_user_id):
         super().__init__(timeout=60)
         self.user_id = user_id
         self.target_user_id = target_user_id
         self.value = None
-        # Füge alle Karten aus karten.py hinzu + Infinitydust
-        self.options = [SelectOption(label=karte["name"], value=karte["name"]) for karte in karten]
-        self.options.append(SelectOption(label="💎 Infinitydust", value="infinitydust"))
-        self.pages = [self.options[i:i + 25] for i in range(0, len(self.options), 25)] or [[]]
+        self.pages = _give_card_option_pages()
         self.page_index = 0
 
         self.select = ui.Select(
@@ -11812,7 +11804,8 @@ class GiveCardSelectView(RestrictedView):
         return f"Wähle eine Karte oder Infinitydust... (Seite {self.page_index + 1}/{len(self.pages)})"
 
     def _build_options_for_current_page(self) -> list[SelectOption]:
-        return self.pages[self.page_index]
+        # Kopie, weil die Seiten zwischen allen Instanzen geteilt werden.
+        return list(self.pages[self.page_index])
 
     async def select_callback(self, interaction: discord.Interaction):
         if interaction.user.id != self.user_id:
@@ -11937,6 +11930,14 @@ class GiveOpRoleSelectView(RestrictedView):
         self.value: int | None = None
         self.add_item(GiveOpRolePicker(self))
 
+
+# Optionen für Mengen: 1-20, dann 25, 30, 40, 50, 70 (25 Optionen total)
+_INFINITYDUST_AMOUNT_OPTIONS: tuple[SelectOption, ...] = tuple(
+    SelectOption(label=f"{i}x Infinitydust", value=str(i))
+    for i in [*range(1, 21), 25, 30, 40, 50, 70]
+)
+
+
 # View für Infinitydust-Mengen-Auswahl
 class InfinitydustAmountView(RestrictedView):
     def __init__(self, user_id, target_user_id):
@@ -11945,10 +11946,12 @@ class InfinitydustAmountView(RestrictedView):
         self.target_user_id = target_user_id
         self.value = None
 
-        # Erstelle Optionen für Mengen: 1-20, dann 25, 30, 40, 50, 70 (25 Optionen total)
-        amounts = list(range(1, 21)) + [25, 30, 40, 50, 70]
-        options = [SelectOption(label=f"{i}x Infinitydust", value=str(i)) for i in amounts]
-        self.select = ui.Select(placeholder="Wähle die Menge...", min_values=1, max_values=1, options=options)
+        self.select = ui.Select(
+            placeholder="Wähle die Menge...",
+            min_values=1,
+            max_values=1,
+            options=list(_INFINITYDUST_AMOUNT_OPTIONS),
+        )
         self.select.callback = self.select_callback
         self.add_item(self.select)
 
@@ -13027,11 +13030,7 @@ class MissionBattleView(BaseBattleView):
                 [atk for atk in self.attacks if isinstance(atk, dict)],
                 self.user_attack_cooldowns,
             )
-        await _safe_send_channel(
-            interaction,
-            interaction.channel,
-            content=f"🏆 Welle {self.wave_num} gewonnen!",
-        )
+        wave_won_text = f"🏆 Welle {self.wave_num} gewonnen!"
         interlude_after_wave = int(self.mission_data.get("interlude_after_wave", 0) or 0)
         if interlude_after_wave == self.wave_num and next_wave == interlude_after_wave + 1:
             if not bool(next_state.get("unit_awarded")):
@@ -13073,13 +13072,16 @@ class MissionBattleView(BaseBattleView):
                 _apply_item_media(interlude_embed, "unit", image=False, thumbnail=True)
             interlude_embed.add_field(name="Heilung", value=game_ui_texts.INTERLUDE_HEAL_FIELD, inline=True)
             pause_view = MissionPauseView(self.user_id, self.selected_card_name, mission_state=next_state)
+            # Sieg-Meldung und Pause in einer Nachricht: ein REST-Aufruf statt zwei.
             await _safe_send_channel(
                 interaction,
                 interaction.channel,
+                content=wave_won_text,
                 embed=interlude_embed,
                 view=pause_view,
             )
             return
+        await _safe_send_channel(interaction, interaction.channel, content=wave_won_text)
         await _launch_mission_encounter_preview_or_wave(
             interaction,
             next_state,
@@ -13527,10 +13529,7 @@ class MissionBattleView(BaseBattleView):
                 attack = current_attacks[i]
                 if i == standard_idx:
                     dmg_max_bonus = 0 if is_bot_turn else self.damage_bonuses.get(i + 1, 0)
-                    display_label, display_style, _ = _attack_display_parts(
-                        attack,
-                        max_only_bonus=dmg_max_bonus,
-                    )
+                    button_label, display_style = self._attack_button_parts(attack, dmg_max_bonus)
                     is_on_cooldown = self.is_attack_on_cooldown_bot(i) if is_bot_turn else self.is_attack_on_cooldown_user(i)
                     is_reload_action = False if is_bot_turn else bool(attack.get("requires_reload") and self.is_reload_needed(self.user_id, i))
                     if is_on_cooldown:
@@ -13543,7 +13542,7 @@ class MissionBattleView(BaseBattleView):
                         button.disabled = False
                     else:
                         button.style = display_style
-                        button.label = _attack_label_with_cd(display_label, attack)
+                        button.label = button_label
                         button.disabled = bool(is_bot_turn)
                     continue
                 attack_name = str(attack.get("name") or f"Angriff {i+1}")
@@ -13559,10 +13558,7 @@ class MissionBattleView(BaseBattleView):
             if i < len(current_attacks):
                 attack = current_attacks[i]
                 dmg_max_bonus = 0 if is_bot_turn else self.damage_bonuses.get(i + 1, 0)
-                display_label, display_style, _ = _attack_display_parts(
-                    attack,
-                    max_only_bonus=dmg_max_bonus,
-                )
+                button_label, display_style = self._attack_button_parts(attack, dmg_max_bonus)
                 is_on_cooldown = self.is_attack_on_cooldown_bot(i) if is_bot_turn else self.is_attack_on_cooldown_user(i)
                 is_reload_action = False if is_bot_turn else bool(attack.get("requires_reload") and self.is_reload_needed(self.user_id, i))
                 if is_on_cooldown:
@@ -13576,7 +13572,7 @@ class MissionBattleView(BaseBattleView):
                     button.disabled = False
                 else:
                     button.style = display_style
-                    button.label = _attack_label_with_cd(display_label, attack)
+                    button.label = button_label
                     button.disabled = bool(is_bot_turn)
             else:
                 button.label = f"Angriff {i+1}"
@@ -14518,7 +14514,9 @@ class MissionBattleView(BaseBattleView):
                 )
             except Exception:
                 logging.exception("Failed to update mission battle before bot turn")
-            await asyncio.sleep(random.uniform(2.0, 5.0))
+            bot_turn_delay = mission_bot_turn_delay()
+            if bot_turn_delay > 0:
+                await asyncio.sleep(bot_turn_delay)
 
         defender_id = self.user_id
         pre_burn_total_player, pre_bot_turn_events = _apply_dot_ticks_for_applier(
@@ -17154,11 +17152,10 @@ async def send_stats_excel_export(interaction: discord.Interaction) -> None:
     await interaction.followup.send("✅ Die Excel-Datei wurde dir per DM geschickt.", ephemeral=True)
 
 async def send_db_debug(interaction: discord.Interaction, visibility_key: str | None = None):
-    async with db_context() as db:
-        cursor = await db.execute("SELECT name FROM sqlite_master WHERE type = 'table' ORDER BY name")
-        tables = [row[0] for row in await cursor.fetchall()]
-        cursor = await db.execute("PRAGMA integrity_check")
-        integrity = await cursor.fetchone()
+    async with db_read_context() as db:
+        tables = [row[0] for row in await db.execute_fetchall("SELECT name FROM sqlite_master WHERE type = 'table' ORDER BY name")]
+        integrity_rows = await db.execute_fetchall("PRAGMA integrity_check")
+        integrity = integrity_rows[0] if integrity_rows else None
     embed = discord.Embed(title="DB Debug", color=0x2b90ff)
     embed.add_field(name="Tables", value=str(len(tables)), inline=True)
     embed.add_field(name="Integrity", value=str(integrity[0] if integrity else "unknown"), inline=True)
@@ -17267,12 +17264,11 @@ async def send_configure_list(interaction: discord.Interaction, visibility_key:
     if interaction.guild is None:
         await _send_with_visibility(interaction, visibility_key, content=SERVER_ONLY)
         return
-    async with db_context() as db:
-        cursor = await db.execute(
+    async with db_read_context() as db:
+        rows = await db.execute_fetchall(
             "SELECT channel_id FROM guild_allowed_channels WHERE guild_id = ?",
             (interaction.guild_id,),
         )
-        rows = await cursor.fetchall()
     if not rows:
         await _send_with_visibility(interaction, visibility_key, content="ℹ️ Es sind noch keine Kanäle erlaubt.")
         return
@@ -17306,10 +17302,12 @@ async def send_vaultlook(interaction: discord.Interaction, user_id: int, user_na
         return
     target_user = _get_member_if_available(interaction.guild, user_id)
     mention = target_user.mention if target_user else f"<@{user_id}>"
-    user_karten = await get_user_karten(user_id)
+    user_karten, infinitydust, units = await asyncio.gather(
+        get_user_karten(user_id),
+        get_infinitydust(user_id),
+        get_units(user_id),
+    )
     grouped_cards = _group_owned_cards_for_current_mode(user_karten)
-    infinitydust = await get_infinitydust(user_id)
-    units = await get_units(user_id)
     if not user_karten and infinitydust == 0:
         await _send_with_visibility(interaction, visibility_key, content=f"❌ {mention} hat noch keine Karten in seiner Sammlung.")
         return
@@ -18349,15 +18347,15 @@ class StatusUserPickerView(RestrictedView):
                 continue
             members.append(m)
 
+        # Status pro Aufbau nur einmal je Mitglied auflösen (Sortierung + Kreis)
+        colors = {m.id: _presence_to_color(m) for m in members}
+
         # Sortieren nach Status (grün, orange, rot, schwarz) und dann Baseline
         def sort_key(m: discord.Member):
-            color = _presence_to_color(m)
-            pri = STATUS_PRIORITY_MAP.get(color, 3)
+            pri = STATUS_PRIORITY_MAP.get(colors[m.id], 3)
             base = self._baseline_index.get(m.id, 10_000_000)
             return (pri, base)
 
-        members_sorted = sorted(members, key=sort_key)
-
         # Optionen aufbauen
         opts: list[SelectOption] = [SelectOption(label="🔍 Nach Name suchen", value="search")]
         if self.include_bot_option:
@@ -18367,9 +18365,8 @@ class StatusUserPickerView(RestrictedView):
         # Maximal 25 Optionen insgesamt
         max_user_opts = 25 - len(opts)
 
-        for m in members_sorted[:max_user_opts]:
-            color = _presence_to_color(m)
-            circle = STATUS_CIRCLE_MAP.get(color, "?")
+        for m in heapq.nsmallest(max_user_opts, members, key=sort_key):
+            circle = STATUS_CIRCLE_MAP.get(colors[m.id], "?")
             opts.append(
                 SelectOption(
                     label=safe_user_option_label(m, prefix=f"{circle} "),
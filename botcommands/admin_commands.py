@@ -700,12 +700,11 @@ def register_admin_commands(bot, module: AdminFacade) -> dict[str, object]:
 
             changed_count = 0
             if action == "group_give":
-                for card in cards_for_group:
-                    card_name = str(card.get("name", "")).strip()
-                    if not card_name:
-                        continue
-                    await module.add_karte_amount(target_user_id, card_name, 1)
-                    changed_count += 1
+                changed_count = await module.add_karten_amounts(
+                    target_user_id,
+                    [str(card.get("name", "")).strip() for card in cards_for_group],
+                    1,
+                )
                 await interaction.followup.send(
                     f"\u2705 {target_name} hat {changed_count} Karte(n) aus `{module._rarity_label_from_key(rarity_key)}` erhalten.",
                     ephemeral=True,
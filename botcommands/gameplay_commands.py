@@ -47,11 +47,11 @@ def register_gameplay_commands(bot, api: GameplayFacade) -> dict[str, object]:
         mission_count = 0
         if not is_admin_user:
             mission_count = await api.get_mission_count(interaction.user.id)
-            if mission_count >= 2:
+            if mission_count >= api.DAILY_MISSION_LIMIT:
                 await api._send_ephemeral(
                     interaction,
                     content=(
-                        "\u274c Du hast heute bereits deine 2 Missionen "
+                        f"\u274c Du hast heute bereits deine {api.DAILY_MISSION_LIMIT} Missionen "
                         "aufgebraucht! Komme morgen wieder."
                     ),
                 )
@@ -1,5 +1,6 @@
 ﻿from __future__ import annotations
 
+import asyncio
 import logging
 
 import discord
@@ -15,11 +16,11 @@ def register_player_commands(bot, module: PlayerFacade) -> dict[str, object]:
         now = int(module.time.time())
         is_admin_user = await module.is_admin(interaction)
         async with module.db_context() as db:
-            cursor = await db.execute(
+            rows = await db.execute_fetchall(
                 "SELECT last_daily FROM user_daily WHERE user_id = ?",
                 (interaction.user.id,),
             )
-            row = await cursor.fetchone()
+            row = rows[0] if rows else None
             if (not is_admin_user) and row and row[0] and now - row[0] < 86400:
                 stunden = int((86400 - (now - row[0])) / 3600)
                 await module._send_ephemeral(
@@ -27,11 +28,6 @@ def register_player_commands(bot, module: PlayerFacade) -> dict[str, object]:
                     content=f"Du kannst deine t\u00e4gliche Belohnung erst in {stunden} Stunden abholen.",
                 )
                 return
-            await db.execute(
-                "INSERT OR REPLACE INTO user_daily (user_id, last_daily) VALUES (?, ?)",
-                (interaction.user.id, now),
-            )
-            await db.commit()
 
         user_id = interaction.user.id
         alpha_enabled = await module.is_alpha_enabled(interaction.guild_id)
@@ -41,7 +37,19 @@ def register_player_commands(bot, module: PlayerFacade) -> dict[str, object]:
             context="daily",
         )
 
-        is_new_card = await module.check_and_add_karte(user_id, karte)
+        # Cooldown-Stempel und Karte/Dust landen in einem Commit.
+        is_new_card = await module.claim_daily_reward(
+            user_id,
+            karte,
+            now,
+            cooldown_seconds=0 if is_admin_user else 86400,
+        )
+        if is_new_card is None:
+            await module._send_ephemeral(
+                interaction,
+                content="Du hast deine t\u00e4gliche Belohnung bereits abgeholt.",
+            )
+            return
         card_name_text = str(karte.get("name") or "Unbekannte Karte")
         embed_color = module._card_rarity_color(karte)
         image_url = str(karte.get("bild") or "").strip()
@@ -128,18 +136,14 @@ def register_player_commands(bot, module: PlayerFacade) -> dict[str, object]:
             logging.info("[INVITED] is_admin_user=%s user=%s", is_admin_user, interaction.user.id)
 
             async with module.db_context() as db:
-                cursor = await db.execute("SELECT DISTINCT user_id FROM user_karten")
-                user_rows = await cursor.fetchall()
-
-                cursor = await db.execute("SELECT DISTINCT user_id FROM user_daily")
-                daily_rows = await cursor.fetchall()
-
-                cursor = await db.execute("SELECT DISTINCT user_id FROM user_infinitydust")
-                dust_rows = await cursor.fetchall()
+                # Ein UNION statt drei DISTINCT-Abfragen; doppelte IDs entfernt SQLite.
+                user_rows = await db.execute_fetchall(
+                    "SELECT user_id FROM user_karten "
+                    "UNION SELECT user_id FROM user_daily "
+                    "UNION SELECT user_id FROM user_infinitydust"
+                )
 
-                all_user_ids = set()
-                for row in user_rows + daily_rows + dust_rows:
-                    all_user_ids.add(row[0])
+                all_user_ids = {row[0] for row in user_rows}
 
                 if interaction.guild is not None:
                     for member in interaction.guild.members:
@@ -262,9 +266,11 @@ def register_player_commands(bot, module: PlayerFacade) -> dict[str, object]:
             return
         visibility_key = module.command_visibility_key_for_interaction(interaction)
         user_id = interaction.user.id
-        user_karten = await module.get_user_karten(user_id)
-        infinitydust = await module.get_infinitydust(user_id)
-        units = await module.get_units(user_id)
+        user_karten, infinitydust, units = await asyncio.gather(
+            module.get_user_karten(user_id),
+            module.get_infinitydust(user_id),
+            module.get_units(user_id),
+        )
 
         if not user_karten and infinitydust == 0:
             await module._send_ephemeral(
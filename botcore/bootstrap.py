@@ -13,6 +13,9 @@ def build_bot_intents() -> discord.Intents:
     intents = discord.Intents.default()
     intents.message_content = True
     intents.members = True
+    # Presences bleiben an: Gegner-/User-Auswahl sortiert nach Online-Status und
+    # zeigt die Status-Kreise, "Alle User anzeigen" filtert Offline-Member.
+    # Ohne das Intent waeren alle Member "offline".
     intents.presences = True
     return intents
 
@@ -55,7 +55,7 @@ def build_command_api(global_ns: dict[str, Any]) -> CommandApi:
         "_send_ephemeral",
         "_send_with_visibility",
         "build_anfang_intro_text",
-        "check_and_add_karte",
+        "claim_daily_reward",
         "command_visibility_key_for_interaction",
         "db_context",
         "get_infinitydust",
@@ -83,6 +83,7 @@ def build_command_api(global_ns: dict[str, Any]) -> CommandApi:
         "BETA_INVITE_DISABLED_TEXT",
         "CardSelectView",
         "ChallengeResponseView",
+        "DAILY_MISSION_LIMIT",
         "MissionAcceptView",
         "OpponentSelectView",
         "StoryPlayerView",
@@ -127,7 +128,7 @@ def build_command_api(global_ns: dict[str, Any]) -> CommandApi:
         "add_give_op_role",
         "add_give_op_user",
         "add_infinitydust",
-        "add_karte_amount",
+        "add_karten_amounts",
         "card_has_multiple_variants",
         "default_variant_name_for_base",
         "has_exact_card_variant",
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import Any, Iterable
 
 from karten import COMMON, RARE
 
@@ -157,3 +157,18 @@ def card_effective_weight(context: str | None, card: dict[str, Any]) -> float:
     base_w = float(rw.get(rarity, 1.0))
     base_name = str(card.get("name") or "").strip()
     return base_w * group_weight_for_card(context, base_name)
+
+
+def card_effective_weights(context: str | None, cards: Iterable[dict[str, Any]]) -> list[float]:
+    # Wie card_effective_weight für eine ganze Ziehliste: Kontext und
+    # Seltenheitsgewichte nur einmal auflösen statt pro Karte.
+    rw = rarity_weights_for_context(context)
+    has_groups = bool(CONTEXT_GROUP_WEIGHTS.get(_normalized_context(context)))
+    weights: list[float] = []
+    for card in cards:
+        rarity = str(card.get("seltenheit") or "").strip() or COMMON
+        base_w = float(rw.get(rarity, 1.0))
+        if has_groups:
+            base_w *= group_weight_for_card(context, str(card.get("name") or "").strip())
+        weights.append(base_w)
+    return weights
@@ -162,15 +162,18 @@ def resolve_multi_hit_damage(
     total = 0
     per_hit_damages: list[int] = []
     if landed > 0:
-        for _ in range(landed):
-            if force_max:
-                rolled = hit_max
-            elif guaranteed_hit:
-                rolled = random.randint(guaranteed_min_per_hit, hit_max)
-            else:
-                rolled = random.randint(hit_min, hit_max)
-            per_hit_damages.append(int(rolled))
-            total += int(rolled)
+        if force_max:
+            # Ohne Würfel: jeder Treffer macht Maximalschaden.
+            if return_details:
+                per_hit_damages = [hit_max] * landed
+            total = hit_max * landed
+        else:
+            roll_min = guaranteed_min_per_hit if guaranteed_hit else hit_min
+            for _ in range(landed):
+                rolled = random.randint(roll_min, hit_max)
+                if return_details:
+                    per_hit_damages.append(rolled)
+                total += rolled
         total += int(buff_amount)
 
     min_possible = 0
@@ -183,22 +186,23 @@ def resolve_multi_hit_damage(
 
     max_possible = hits * hit_max + int(buff_amount)
 
+    total_before_multiplier = total
     if attack_multiplier != 1.0:
         total = int(round(total * attack_multiplier))
         min_possible = int(round(min_possible * attack_multiplier))
         max_possible = int(round(max_possible * attack_multiplier))
 
     final_total = max(0, total)
-    details.update(
-        {
-            "hits": hits,
-            "landed_hits": int(landed),
-            "per_hit_damages": per_hit_damages,
-            "total_before_multiplier": int(sum(per_hit_damages) + (int(buff_amount) if landed > 0 else 0)),
-            "total_damage": int(final_total),
-        }
-    )
     if return_details:
+        details.update(
+            {
+                "hits": hits,
+                "landed_hits": int(landed),
+                "per_hit_damages": per_hit_damages,
+                "total_before_multiplier": int(total_before_multiplier),
+                "total_damage": int(final_total),
+            }
+        )
         return final_total, max(0, min_possible), max(0, max_possible), details
     return final_total, max(0, min_possible), max(0, max_possible)
 
@@ -211,6 +215,9 @@ def apply_outgoing_attack_modifier(raw_damage: int, *, percent: float = 0.0, fla
     damage = max(0, int(raw_damage))
     if damage <= 0:
         return 0, 0
+    if not percent and not flat:
+        # Häufigster Fall: keine Schwächung aktiv.
+        return damage, 0
 
     reduction_pct = max(0.0, min(1.0, float(percent or 0.0)))
     if reduction_pct > 0:
@@ -305,14 +312,16 @@ def _keep_last_rounds(text: str, max_rounds: int | None) -> str:
     if max_rounds is None:
         return text
     max_rounds = max(1, int(max_rounds))
-    parts = text.split("\n\n**Runde ")
-    if len(parts) <= 1:
-        return text
-    header = parts[0]
-    rounds = parts[1:]
-    kept = rounds[-max_rounds:]
-    rebuilt = header + "".join("\n\n**Runde " + part for part in kept)
-    return rebuilt
+    needle = "\n\n**Runde "
+    # Von hinten den Beginn der max_rounds-letzten Runde suchen; gibt es so
+    # viele nicht, bleibt der Text unverändert.
+    start = len(text)
+    for _ in range(max_rounds):
+        start = text.rfind(needle, 0, start)
+        if start < 0:
+            return text
+    header_end = text.find(needle)
+    return text[:header_end] + text[start:]
 
 
 def _display_name(user_obj) -> str:
@@ -487,7 +496,7 @@ def build_battle_log_entry(
             )
         ]
         if lines:
-            effect_text = "\n" + "\n".join(f"- {line}" for line in lines[:8])
+            effect_text = "\n- " + "\n- ".join(lines[:8])
     damage_breakdown = _damage_breakdown_lines(
         actual_damage=int(actual_damage or 0),
         pre_effect_damage=int(pre_effect_damage or 0),
@@ -495,7 +504,7 @@ def build_battle_log_entry(
     )
     breakdown_text = ""
     if damage_breakdown:
-        breakdown_text = "\n" + "\n".join(f"- {line}" for line in damage_breakdown)
+        breakdown_text = "\n- " + "\n- ".join(damage_breakdown)
 
     if int(actual_damage or 0) == 0 and heal_amount > 0:
         attack_line = (
@@ -594,6 +603,54 @@ def update_battle_log(
     return existing_embed
 
 
+_BATTLE_TONE_COLORS = {
+    "crit": 0xE74C3C,
+    "heal": 0x2ECC71,
+    "buff": 0xF1C40F,
+    "hit": 0x3498DB,
+}
+
+# Effekt-Typ -> (Label, Dauer anzeigen) für das Status-Feld im Kampf-Embed.
+_EFFECT_STATUS_LABELS: dict[str, tuple[str, bool]] = {
+    "burning": ("🔥 Brand", True),
+    "poison": ("☠️ Gift", True),
+    "bleeding": ("🩸 Blutung", True),
+    "confusion": ("🌀 Verwirrt", True),
+    "stealth": ("🥷 Tarnung", False),
+    "airborne": ("✈️ Flugphase", False),
+    "regen": ("💚 Regen", True),
+    "stun": ("🛑 Stun", True),
+}
+
+
+def _effect_status_text(effect_entries: list[dict] | None) -> str:
+    labels: list[str] = []
+    seen: set[str] = set()
+    for effect in effect_entries or []:
+        effect_type = str(effect.get("type") or "").strip().lower()
+        if not effect_type or effect_type in seen:
+            continue
+        seen.add(effect_type)
+        entry = _EFFECT_STATUS_LABELS.get(effect_type)
+        if entry is None:
+            continue
+        label, with_duration = entry
+        duration = int(effect.get("duration", 0) or 0)
+        labels.append(f"{label}({duration})" if with_duration and duration > 0 else label)
+    return ", ".join(labels[:4]) if labels else "Keine"
+
+
+def _battle_card_label(marker: str, user_name: str, effect_types: set[str], *, active: bool) -> str:
+    label = (
+        f"{marker} {user_name}'s Karte"
+        f"{'\U0001f525' if 'burning' in effect_types else ''}"
+        f"{' \U0001f300' if 'confusion' in effect_types else ''}"
+        f"{' \U0001f977' if 'stealth' in effect_types else ''}"
+        f"{' \u2708\ufe0f' if 'airborne' in effect_types else ''}"
+    )
+    return f"**{label}**" if active else label
+
+
 def create_battle_embed(
     player1_card: CardData,
     player2_card: CardData,
@@ -613,102 +670,36 @@ def create_battle_embed(
     user1_mention = user1.mention if user1 else "Bot"
     user2_mention = user2.mention if user2 else "Bot"
 
-    tone_color_map = {
-        "crit": 0xE74C3C,
-        "heal": 0x2ECC71,
-        "buff": 0xF1C40F,
-        "hit": 0x3498DB,
-    }
     embed = discord.Embed(
         title="**1v1 Kampf beginnt!**",
         description=f"**{user1_mention} vs {user2_mention}**",
-        color=tone_color_map.get(str(highlight_tone or "").strip().lower(), 0x2F3136),
+        color=_BATTLE_TONE_COLORS.get(str(highlight_tone or "").strip().lower(), 0x2F3136),
     )
 
-    current_card = player1_card if current_turn == (user1.id if user1 else 0) else player2_card
-    other_card = player2_card if current_turn == (user1.id if user1 else 0) else player1_card
+    player1_turn = current_turn == (user1.id if user1 else 0)
+    current_card = player1_card if player1_turn else player2_card
+    other_card = player2_card if player1_turn else player1_card
 
     embed.set_image(url=current_card["bild"])
     embed.set_thumbnail(url=other_card["bild"])
 
     player1_id = user1.id if hasattr(user1, "id") else 0
     player2_id = user2.id if hasattr(user2, "id") else 0
-    player1_burning = active_effects and any(e["type"] == "burning" for e in active_effects.get(player1_id, []))
-    player2_burning = active_effects and any(e["type"] == "burning" for e in active_effects.get(player2_id, []))
-    player1_confused = active_effects and any(e["type"] == "confusion" for e in active_effects.get(player1_id, []))
-    player2_confused = active_effects and any(e["type"] == "confusion" for e in active_effects.get(player2_id, []))
-    player1_stealth = active_effects and any(e["type"] == "stealth" for e in active_effects.get(player1_id, []))
-    player2_stealth = active_effects and any(e["type"] == "stealth" for e in active_effects.get(player2_id, []))
-    player1_airborne = active_effects and any(e["type"] == "airborne" for e in active_effects.get(player1_id, []))
-    player2_airborne = active_effects and any(e["type"] == "airborne" for e in active_effects.get(player2_id, []))
-
-    if current_turn == (user1.id if user1 else 0):
-        player1_label = (
-            f"**\U0001f7e5 {user1_name}'s Karte"
-            f"{'\U0001f525' if player1_burning else ''}"
-            f"{' \U0001f300' if player1_confused else ''}"
-            f"{' \U0001f977' if player1_stealth else ''}"
-            f"{' \u2708\ufe0f' if player1_airborne else ''}**"
-        )
-        player2_label = (
-            f"\U0001f7e6 {user2_name}'s Karte"
-            f"{'\U0001f525' if player2_burning else ''}"
-            f"{' \U0001f300' if player2_confused else ''}"
-            f"{' \U0001f977' if player2_stealth else ''}"
-            f"{' \u2708\ufe0f' if player2_airborne else ''}"
-        )
-    else:
-        player1_label = (
-            f"\U0001f7e5 {user1_name}'s Karte"
-            f"{'\U0001f525' if player1_burning else ''}"
-            f"{' \U0001f300' if player1_confused else ''}"
-            f"{' \U0001f977' if player1_stealth else ''}"
-            f"{' \u2708\ufe0f' if player1_airborne else ''}"
-        )
-        player2_label = (
-            f"**\U0001f7e6 {user2_name}'s Karte"
-            f"{'\U0001f525' if player2_burning else ''}"
-            f"{' \U0001f300' if player2_confused else ''}"
-            f"{' \U0001f977' if player2_stealth else ''}"
-            f"{' \u2708\ufe0f' if player2_airborne else ''}**"
-        )
+    # Ein Durchlauf pro Spieler statt je einem any() pro Effekt-Icon.
+    player1_types = {e["type"] for e in active_effects.get(player1_id, [])} if active_effects else set()
+    player2_types = {e["type"] for e in active_effects.get(player2_id, [])} if active_effects else set()
+
+    player1_label = _battle_card_label("\U0001f7e5", user1_name, player1_types, active=player1_turn)
+    player2_label = _battle_card_label("\U0001f7e6", user2_name, player2_types, active=not player1_turn)
 
     embed.add_field(name=player1_label, value=f"{player1_card['name']}\nHP: {player1_hp}", inline=True)
     embed.add_field(name=player2_label, value=f"{player2_card['name']}\nHP: {player2_hp}", inline=True)
     embed.add_field(
         name="\u2694\ufe0f",
-        value=f"**{user1_mention if current_turn == (user1.id if user1 else 0) else user2_mention} ist an der Reihe**",
+        value=f"**{user1_mention if player1_turn else user2_mention} ist an der Reihe**",
         inline=False,
     )
 
-    def _effect_status_text(effect_entries: list[dict] | None) -> str:
-        entries = effect_entries or []
-        labels: list[str] = []
-        seen: set[str] = set()
-        for effect in entries:
-            effect_type = str(effect.get("type") or "").strip().lower()
-            if not effect_type or effect_type in seen:
-                continue
-            seen.add(effect_type)
-            duration = int(effect.get("duration", 0) or 0)
-            if effect_type == "burning":
-                labels.append(f"🔥 Brand({duration})" if duration > 0 else "🔥 Brand")
-            elif effect_type == "poison":
-                labels.append(f"☠️ Gift({duration})" if duration > 0 else "☠️ Gift")
-            elif effect_type == "bleeding":
-                labels.append(f"🩸 Blutung({duration})" if duration > 0 else "🩸 Blutung")
-            elif effect_type == "confusion":
-                labels.append(f"🌀 Verwirrt({duration})" if duration > 0 else "🌀 Verwirrt")
-            elif effect_type == "stealth":
-                labels.append("🥷 Tarnung")
-            elif effect_type == "airborne":
-                labels.append("✈️ Flugphase")
-            elif effect_type == "regen":
-                labels.append(f"💚 Regen({duration})" if duration > 0 else "💚 Regen")
-            elif effect_type == "stun":
-                labels.append(f"🛑 Stun({duration})" if duration > 0 else "🛑 Stun")
-        return ", ".join(labels[:4]) if labels else "Keine"
-
     if active_effects:
         p1_status = _effect_status_text(active_effects.get(player1_id, []))
         p2_status = _effect_status_text(active_effects.get(player2_id, []))
@@ -732,7 +723,7 @@ def create_battle_embed(
     if recent_log_lines:
         cleaned = [str(line).strip() for line in recent_log_lines if str(line).strip()]
         if cleaned:
-            preview_value = "\n".join(f"• {line}" for line in cleaned[:2])
+            preview_value = "• " + "\n• ".join(cleaned[:2])
             if len(preview_value) > 1024:
                 preview_value = preview_value[:1021] + "..."
             embed.add_field(name="Letzte Angriffe", value=preview_value, inline=False)
@@ -3,9 +3,9 @@ from __future__ import annotations
 import random
 from typing import Iterable
 
-from reward_spawn_config import card_effective_weight
+from reward_spawn_config import card_effective_weights
 from services.battle_types import CardData
-from services.card_variants import base_card_name, build_runtime_card, reward_runtime_cards
+from services.card_variants import base_card_name, build_runtime_card, reward_variant_candidates, runtime_card_name
 
 
 ALPHA_PLAYABLE_CARD_NAMES: tuple[str, ...] = (
@@ -76,9 +76,9 @@ def canonical_card_name(name: object) -> str:
     raw = str(name or "").strip()
     if not raw:
         return ""
-    runtime_card = build_runtime_card(raw)
-    if runtime_card is not None:
-        return str(runtime_card.get("name") or raw)
+    resolved_name = runtime_card_name(raw)
+    if resolved_name is not None:
+        return resolved_name or raw
     base_alias = CARD_NAME_ALIASES.get(raw.lower())
     if base_alias:
         return base_alias
@@ -113,17 +113,19 @@ def random_gameplay_card(
     alpha_enabled: bool,
     context: str | None = None,
 ) -> CardData:
-    pool = reward_runtime_cards(gameplay_cards(cards, alpha_enabled=alpha_enabled))
+    # Erst ziehen, dann nur die gezogene Karte als Laufzeitkarte kopieren.
+    pool = reward_variant_candidates(gameplay_cards(cards, alpha_enabled=alpha_enabled))
     if not pool:
         raise ValueError("No playable cards available for the current mode")
-    weights = [card_effective_weight(context, c) for c in pool]
-    total = sum(weights)
-    if total <= 0:
-        return random.choice(pool)
-    r = random.uniform(0, total)
-    acc = 0.0
-    for card, w in zip(pool, weights):
-        acc += w
-        if r <= acc:
-            return card
-    return pool[-1]
+    weights = card_effective_weights(
+        context,
+        ({"name": name, "seltenheit": card.get("seltenheit")} for card, _variant_id, name in pool),
+    )
+    if sum(weights) <= 0:
+        card, variant_id, _name = random.choice(pool)
+    else:
+        card, variant_id, _name = random.choices(pool, weights=weights)[0]
+    runtime_card = build_runtime_card(variant_id, cards=[card])
+    if runtime_card is None:
+        raise ValueError(f"Card variant {variant_id!r} could not be built")
+    return runtime_card
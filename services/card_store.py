@@ -22,6 +22,7 @@ import logging
 from datetime import datetime, timezone
 
 from db import db_context
+from services.card_variants import bump_cards_version
 
 # Diese Felder darf die Website ändern. Muss zur Liste in
 # web/app/karteneditor.py passen.
@@ -153,5 +154,7 @@ async def anwenden(karten_liste: list) -> int:
                 karte[feld] = wert
         getroffen += 1
     if getroffen:
+        # Namensindex & Co. halten normalisierte Kopien von Bild und Varianten.
+        bump_cards_version()
         logging.info("%s Karten aus der Datenbank angepasst", getroffen)
     return getroffen
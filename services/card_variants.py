@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import copy
+from collections import OrderedDict
 from typing import Any, Iterable
 
 from karten import karten as BASE_CARDS
@@ -14,6 +15,14 @@ def _cards_source(cards: Iterable[CardData] | None = None) -> list[CardData]:
     return list(BASE_CARDS if cards is None else cards)
 
 
+def _reusable_cards(cards: Iterable[CardData] | None) -> Iterable[CardData] | None:
+    # Einmal-Iteratoren festhalten; Listen und Kataloge bleiben dasselbe Objekt,
+    # damit mehrere Suchen denselben Namensindex treffen.
+    if cards is None or iter(cards) is not cards:
+        return cards
+    return list(cards)
+
+
 def iter_card_variants(card: CardData) -> list[VariantData]:
     base_name = str(card.get("name") or "").strip()
     image_url = str(card.get("bild") or "").strip()
@@ -67,24 +76,68 @@ def iter_card_variants(card: CardData) -> list[VariantData]:
     return normalized
 
 
+CardLookup = tuple[CardData, VariantData | None]
+
+# Namensindex pro Kartenliste: kleingeschriebener Basis- bzw. Varianten-Name ->
+# (Karte, Variante). Schlüssel ist die id der übergebenen Liste; der Eintrag hält
+# die Liste selbst fest, damit die id nicht wiederverwendet werden kann. Ändern
+# sich die Karten (card_store.anwenden), wird über bump_cards_version() neu gebaut.
+# Kleine Wegwerf-Listen (z. B. [karte] bei jeder Belohnungsziehung) werden nicht
+# gecacht; der Rest ist ein LRU, damit der Katalog-Index nicht mit verdrängt wird.
+_NAME_INDEX_CACHE: OrderedDict[int, tuple[Iterable[CardData], int, dict[str, CardLookup]]] = OrderedDict()
+_NAME_INDEX_CACHE_MAX = 32
+_NAME_INDEX_MIN_CARDS = 8
+_cards_version = 0
+
+
+def cards_version() -> int:
+    return _cards_version
+
+
+def bump_cards_version() -> None:
+    """Nach Änderungen an Karten oder Kartenliste aufrufen; verwirft abgeleitete Caches."""
+    global _cards_version
+    _cards_version += 1
+
+
+def _build_name_index(source: list[CardData]) -> dict[str, CardLookup]:
+    index: dict[str, CardLookup] = {}
+    # Gleiche Reihenfolge wie die frühere lineare Suche: erster Treffer gewinnt.
+    for card in source:
+        base_name = str(card.get("name") or "").strip()
+        index.setdefault(base_name.lower(), (card, None))
+        for variant in iter_card_variants(card):
+            variant_id = str(variant.get("variant_id") or "").strip()
+            index.setdefault(variant_id.lower(), (card, variant))
+    return index
+
+
+def _name_index(cards: Iterable[CardData] | None = None) -> dict[str, CardLookup]:
+    owner = BASE_CARDS if cards is None else cards
+    if isinstance(owner, (list, tuple)) and len(owner) < _NAME_INDEX_MIN_CARDS:
+        return _build_name_index(list(owner))
+    key = id(owner)
+    entry = _NAME_INDEX_CACHE.get(key)
+    if entry is not None and entry[1] == _cards_version:
+        _NAME_INDEX_CACHE.move_to_end(key)
+        return entry[2]
+    index = _build_name_index(_cards_source(owner))
+    _NAME_INDEX_CACHE[key] = (owner, _cards_version, index)
+    _NAME_INDEX_CACHE.move_to_end(key)
+    if len(_NAME_INDEX_CACHE) > _NAME_INDEX_CACHE_MAX:
+        _NAME_INDEX_CACHE.popitem(last=False)
+    return index
+
+
 def _find_card_and_variant(
     name: object,
     *,
     cards: Iterable[CardData] | None = None,
-) -> tuple[CardData, VariantData | None] | None:
+) -> CardLookup | None:
     wanted = str(name or "").strip()
     if not wanted:
         return None
-    wanted_lower = wanted.lower()
-    for card in _cards_source(cards):
-        base_name = str(card.get("name") or "").strip()
-        if base_name.lower() == wanted_lower:
-            return card, None
-        for variant in iter_card_variants(card):
-            variant_id = str(variant.get("variant_id") or "").strip()
-            if variant_id.lower() == wanted_lower:
-                return card, variant
-    return None
+    return _name_index(cards).get(wanted.lower())
 
 
 def base_card_name(name: object, *, cards: Iterable[CardData] | None = None) -> str:
@@ -131,6 +184,19 @@ def normalize_owned_card_name(name: object, *, cards: Iterable[CardData] | None
     return default_variant_name_for_base(card.get("name"), cards=cards)
 
 
+def runtime_card_name(name: object, *, cards: Iterable[CardData] | None = None) -> str | None:
+    # Derselbe Name, den build_runtime_card setzen würde, aber ohne die Karte
+    # zu kopieren (für reine Namensauflösung).
+    resolved = _find_card_and_variant(name, cards=cards)
+    if resolved is None:
+        return None
+    card, variant = resolved
+    if variant is None:
+        return str(card.get("name") or "")
+    base_name = str(card.get("name") or "").strip()
+    return str(variant.get("display_name") or variant.get("variant_id") or base_name).strip() or base_name
+
+
 def build_runtime_card(
     name: object,
     *,
@@ -175,6 +241,30 @@ def reward_runtime_cards(cards: Iterable[CardData] | None = None) -> list[CardDa
     return reward_cards
 
 
+def reward_variant_candidates(cards: Iterable[CardData] | None = None) -> list[tuple[CardData, str, str]]:
+    """(Karte, variant_id, Kartenname) aller ziehbaren Varianten.
+
+    Dieselbe Auswahl wie ``reward_runtime_cards()``, aber ohne jede Karte tief
+    zu kopieren. Für Zufallsziehungen, die am Ende nur eine Karte brauchen:
+    erst auswählen, dann ``build_runtime_card(variant_id, cards=[karte])``.
+    """
+    candidates: list[tuple[CardData, str, str]] = []
+    for card in _cards_source(cards):
+        base_name = str(card.get("name") or "").strip()
+        for variant in iter_card_variants(card):
+            if not bool(variant.get("reward_enabled", True)):
+                continue
+            variant_id = str(variant.get("variant_id") or "").strip()
+            if not variant_id:
+                continue
+            # Trägt die Variante den Basisnamen, liefert build_runtime_card die Basiskarte.
+            if variant_id.lower() == base_name.lower():
+                candidates.append((card, variant_id, base_name))
+            else:
+                candidates.append((card, variant_id, str(variant.get("display_name") or variant_id)))
+    return candidates
+
+
 def variant_count_for_base(base_name: object, *, cards: Iterable[CardData] | None = None) -> int:
     return len(variant_names_for_base(base_name, cards=cards))
 
@@ -185,17 +275,17 @@ def exact_variant_names_with_amounts(
     *,
     cards: Iterable[CardData] | None = None,
 ) -> list[tuple[str, int]]:
-    source_cards = _cards_source(cards)
+    cards = _reusable_cards(cards)
     target_base = base_card_name(base_name, cards=cards)
     if not target_base:
         return []
     collected: dict[str, int] = {}
     for raw_name, raw_amount in owned_cards:
-        normalized_name = normalize_owned_card_name(raw_name, cards=source_cards)
-        if base_card_name(normalized_name, cards=source_cards) != target_base:
+        normalized_name = normalize_owned_card_name(raw_name, cards=cards)
+        if base_card_name(normalized_name, cards=cards) != target_base:
             continue
         collected[normalized_name] = collected.get(normalized_name, 0) + int(raw_amount)
-    resolved = _find_card_and_variant(target_base, cards=source_cards)
+    resolved = _find_card_and_variant(target_base, cards=cards)
     variant_order = {
         str(variant.get("variant_id") or ""): int(variant.get("sort_order", 0) or 0)
         for variant in (iter_card_variants(resolved[0]) if resolved is not None else [])
@@ -211,6 +301,7 @@ def group_owned_cards_by_base(
     *,
     cards: Iterable[CardData] | None = None,
 ) -> list[dict[str, Any]]:
+    cards = _reusable_cards(cards)
     source_cards = _cards_source(cards)
     order_map = {str(card.get("name") or ""): index for index, card in enumerate(source_cards)}
     grouped: dict[str, dict[str, Any]] = {}
@@ -218,8 +309,8 @@ def group_owned_cards_by_base(
         amount = int(raw_amount or 0)
         if amount <= 0:
             continue
-        normalized_name = normalize_owned_card_name(raw_name, cards=source_cards)
-        base_name = base_card_name(normalized_name, cards=source_cards)
+        normalized_name = normalize_owned_card_name(raw_name, cards=cards)
+        base_name = base_card_name(normalized_name, cards=cards)
         if not base_name:
             continue
         group = grouped.setdefault(
@@ -239,7 +330,7 @@ def group_owned_cards_by_base(
         variant_rows = exact_variant_names_with_amounts(
             [(name, int(amount)) for name, amount in variants_map.items()],
             base_name,
-            cards=source_cards,
+            cards=cards,
         )
         result.append(
             {
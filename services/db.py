@@ -1,6 +1,7 @@
 ﻿import logging
 import os
 from contextlib import asynccontextmanager
+from pathlib import Path
 
 import aiosqlite
 
@@ -9,7 +10,14 @@ from services.card_variants import default_variant_name_for_base, iter_card_vari
 
 DB_PATH = os.getenv("KARTENBOT_DB_PATH", "kartenbot.db")
 
+# Lese-Verbindungen neben der einen Schreib-Verbindung. WAL erlaubt beliebig
+# viele Leser parallel zu einem Schreiber; jede aiosqlite-Verbindung hat ihren
+# eigenen Thread, reine SELECTs stauen sich so nicht hinter Schreibzugriffen.
+READER_COUNT = max(2, min(4, os.cpu_count() or 2))
+
 _db = None
+_readers: list[aiosqlite.Connection] = []
+_reader_turn = 0
 
 
 async def connect_db():
@@ -22,26 +30,80 @@ async def connect_db():
         # Bot mitten in einem Schreibvorgang abstürzt, und erlaubt gleichzeitiges Lesen.
         await _db.execute("PRAGMA journal_mode = WAL")
         await _db.execute("PRAGMA synchronous = NORMAL")
+        # Die Verbindung lebt so lange wie der Bot. Temp-Tabellen im RAM und ein
+        # größerer Page-Cache (~64 MB) halten heiße Tabellen zwischen Befehlen warm;
+        # busy_timeout wartet kurz, statt bei parallelem Zugriff (Website) sofort
+        # mit "database is locked" abzubrechen.
+        await _db.execute("PRAGMA temp_store = MEMORY")
+        await _db.execute("PRAGMA cache_size = -64000")
+        await _db.execute("PRAGMA busy_timeout = 5000")
     return _db
 
 
+async def _open_reader() -> aiosqlite.Connection:
+    reader = await aiosqlite.connect(f"file:{Path(DB_PATH).as_posix()}?mode=ro", uri=True)
+    reader.row_factory = aiosqlite.Row
+    await reader.execute("PRAGMA temp_store = MEMORY")
+    await reader.execute("PRAGMA cache_size = -64000")
+    await reader.execute("PRAGMA busy_timeout = 5000")
+    return reader
+
+
+async def connect_reader():
+    global _reader_turn
+    # Erst die Schreib-Verbindung: sie legt Datei und WAL an, bevor ein
+    # read-only-Leser sie öffnen kann.
+    await connect_db()
+    if len(_readers) < READER_COUNT:
+        reader = await _open_reader()
+        # Gleichzeitige erste Aufrufe öffnen mehr Leser als erlaubt; wer nach
+        # dem await keinen Platz mehr findet, schließt seinen wieder.
+        if len(_readers) < READER_COUNT:
+            _readers.append(reader)
+            return reader
+        await reader.close()
+    _reader_turn = (_reader_turn + 1) % len(_readers)
+    return _readers[_reader_turn]
+
+
 async def close_db():
     global _db
+    while _readers:
+        await _readers.pop().close()
     if _db is not None:
         await _db.close()
         _db = None
 
 
+def _log_db_error(exc: Exception) -> None:
+    if isinstance(exc, aiosqlite.OperationalError) and "no such table: active_sessions" in str(exc).lower():
+        logging.debug("DB table active_sessions is not available yet")
+    else:
+        logging.exception("DB operation failed")
+
+
 @asynccontextmanager
 async def db_context():
     db = await connect_db()
     try:
         yield db
     except Exception as exc:
-        if isinstance(exc, aiosqlite.OperationalError) and "no such table: active_sessions" in str(exc).lower():
-            logging.debug("DB table active_sessions is not available yet")
-        else:
-            logging.exception("DB operation failed")
+        _log_db_error(exc)
+        raise
+
+
+@asynccontextmanager
+async def db_read_context():
+    """Verbindung für reine SELECTs.
+
+    Sieht nur committete Daten. Wer innerhalb einer offenen Schreib-Transaktion
+    liest, bleibt bei ``db_context()``.
+    """
+    db = await connect_reader()
+    try:
+        yield db
+    except Exception as exc:
+        _log_db_error(exc)
         raise
 
 
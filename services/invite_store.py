@@ -289,14 +289,11 @@ async def finalize_invite_pending_if_ready(pending_id: int, *, alpha_enabled: bo
             if not invitee_is_admin:
                 await db.execute(
                     """
-                    INSERT OR REPLACE INTO user_daily (user_id, last_daily, used_invite)
-                    VALUES (
-                        ?,
-                        COALESCE((SELECT last_daily FROM user_daily WHERE user_id = ?), 0),
-                        1
-                    )
+                    INSERT INTO user_daily (user_id, last_daily, used_invite)
+                    VALUES (?, 0, 1)
+                    ON CONFLICT(user_id) DO UPDATE SET used_invite = 1
                     """,
-                    (invitee_id, invitee_id),
+                    (invitee_id,),
                 )
             await db.commit()
         except Exception:
@@ -1,19 +1,34 @@
 import json
 import random
 import time
-from datetime import datetime
+from datetime import datetime, time as dtime, timedelta
 from zoneinfo import ZoneInfo
 
+from battle_flow_config import DAILY_MISSION_LIMIT
 from db import db_context
+from services.db import db_read_context
 from karten import karten
 from services.card_variants import base_card_name, build_runtime_card, has_exact_variant, normalize_owned_card_name
 from services.card_pool import random_gameplay_card
 
 
+_BERLIN_TZ = ZoneInfo("Europe/Berlin")
+# (gültig bis, Mitternacht) – der Tagesbeginn ändert sich nur einmal pro Tag.
+_midnight_cache: tuple[float, int] = (0.0, 0)
+
+
 def _berlin_midnight_epoch() -> int:
-    now = datetime.now(ZoneInfo("Europe/Berlin"))
+    global _midnight_cache
+    now_ts = time.time()
+    valid_until, midnight_ts = _midnight_cache
+    if now_ts < valid_until:
+        return midnight_ts
+    now = datetime.fromtimestamp(now_ts, _BERLIN_TZ)
     midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
-    return int(midnight.timestamp())
+    next_midnight = datetime.combine(midnight.date() + timedelta(days=1), dtime.min, tzinfo=_BERLIN_TZ)
+    midnight_ts = int(midnight.timestamp())
+    _midnight_cache = (next_midnight.timestamp(), midnight_ts)
+    return midnight_ts
 
 
 async def add_infinitydust(user_id: int, amount: int = 1) -> None:
@@ -28,7 +43,7 @@ async def add_infinitydust(user_id: int, amount: int = 1) -> None:
 
 
 async def get_infinitydust(user_id):
-    async with db_context() as db:
+    async with db_read_context() as db:
         cursor = await db.execute("SELECT amount FROM user_infinitydust WHERE user_id = ?", (user_id,))
         row = await cursor.fetchone()
         return row[0] if row and row[0] else 0
@@ -47,7 +62,7 @@ async def add_units(user_id: int, amount: int = 1) -> None:
 
 
 async def get_units(user_id: int) -> int:
-    async with db_context() as db:
+    async with db_read_context() as db:
         cursor = await db.execute("SELECT amount FROM user_units WHERE user_id = ?", (user_id,))
         row = await cursor.fetchone()
         return int(row[0] or 0) if row else 0
@@ -244,7 +259,7 @@ async def remove_invalid_damage_card_buffs(*, user_id: int | None = None, card_n
 async def get_card_buffs(user_id: int, card_name: str) -> list[tuple[str, int, int]]:
     normalized_card_name = base_card_name(card_name, cards=karten)
     await remove_invalid_damage_card_buffs(user_id=user_id, card_name=normalized_card_name)
-    async with db_context() as db:
+    async with db_read_context() as db:
         cursor = await db.execute(
             """
             SELECT buff_type, attack_number, buff_amount
@@ -275,21 +290,53 @@ async def add_karte(user_id, karten_name):
         await db.commit()
 
 
+async def _add_karte_or_dust(db, user_id, normalized_name: str) -> bool:
+    # Neue Karte anlegen oder, wenn schon vorhanden (rowcount 0), im selben
+    # Zug 1 Infinitydust gutschreiben. Committen muss der Aufrufer.
+    cursor = await db.execute(
+        "INSERT INTO user_karten (user_id, karten_name, anzahl) VALUES (?, ?, 1) "
+        "ON CONFLICT(user_id, karten_name) DO NOTHING",
+        (user_id, normalized_name),
+    )
+    is_new_card = cursor.rowcount == 1
+    if not is_new_card:
+        await db.execute(
+            "INSERT INTO user_infinitydust (user_id, amount) VALUES (?, 1) "
+            "ON CONFLICT(user_id) DO UPDATE SET amount = amount + excluded.amount",
+            (user_id,),
+        )
+    return is_new_card
+
+
 async def check_and_add_karte(user_id, karte):
     normalized_name = normalize_owned_card_name(karte["name"], cards=karten)
     async with db_context() as db:
-        cursor = await db.execute(
-            "SELECT COUNT(*) FROM user_karten WHERE user_id = ? AND karten_name = ?",
-            (user_id, normalized_name),
-        )
-        row = await cursor.fetchone()
+        is_new_card = await _add_karte_or_dust(db, user_id, normalized_name)
+        await db.commit()
+    return is_new_card
 
-    if row and int(row[0] or 0) > 0:
-        await add_infinitydust(user_id, 1)
-        return False
 
-    await add_karte(user_id, normalized_name)
-    return True
+async def claim_daily_reward(user_id, karte, claimed_at: int, *, cooldown_seconds: int = 86400) -> bool | None:
+    """Stempelt /täglich und vergibt die Karte in einer Transaktion.
+
+    Gibt wie ``check_and_add_karte`` zurück, ob die Karte neu war, oder None,
+    wenn der Cooldown noch läuft (z. B. bei doppelt abgeschicktem Befehl).
+    """
+    normalized_name = normalize_owned_card_name(karte["name"], cards=karten)
+    async with db_context() as db:
+        cursor = await db.execute(
+            "INSERT INTO user_daily (user_id, last_daily) VALUES (?, ?) "
+            "ON CONFLICT(user_id) DO UPDATE SET last_daily = excluded.last_daily "
+            "WHERE COALESCE(user_daily.last_daily, 0) = 0 "
+            "OR excluded.last_daily - user_daily.last_daily >= ?",
+            (user_id, int(claimed_at), int(cooldown_seconds)),
+        )
+        if cursor.rowcount != 1:
+            await db.commit()
+            return None
+        is_new_card = await _add_karte_or_dust(db, user_id, normalized_name)
+        await db.commit()
+    return is_new_card
 
 
 async def add_karte_amount(user_id, karten_name, amount: int):
@@ -305,6 +352,30 @@ async def add_karte_amount(user_id, karten_name, amount: int):
         await db.commit()
 
 
+async def add_karten_amounts(user_id, karten_namen, amount: int = 1) -> int:
+    """Mehrere Karten auf einmal gutschreiben (eine Transaktion, ein Commit).
+
+    Gibt die Anzahl der gutgeschriebenen Karten zurück.
+    """
+    if amount <= 0:
+        return 0
+    rows = [
+        (user_id, normalize_owned_card_name(name, cards=karten), amount)
+        for name in karten_namen
+        if str(name or "").strip()
+    ]
+    if not rows:
+        return 0
+    async with db_context() as db:
+        await db.executemany(
+            "INSERT INTO user_karten (user_id, karten_name, anzahl) VALUES (?, ?, ?) "
+            "ON CONFLICT(user_id, karten_name) DO UPDATE SET anzahl = anzahl + excluded.anzahl",
+            rows,
+        )
+        await db.commit()
+    return len(rows)
+
+
 async def remove_karte_amount(user_id, karten_name, amount: int) -> int:
     if amount <= 0:
         return 0
@@ -352,7 +423,9 @@ async def get_mission_count(user_id):
 
         if not row or row[1] is None or row[1] < today_start:
             await db.execute(
-                "INSERT OR REPLACE INTO user_daily (user_id, mission_count, last_mission_reset) VALUES (?, 0, ?)",
+                "INSERT INTO user_daily (user_id, mission_count, last_mission_reset) VALUES (?, 0, ?) "
+                "ON CONFLICT(user_id) DO UPDATE SET mission_count = 0, "
+                "last_mission_reset = excluded.last_mission_reset",
                 (user_id, today_start),
             )
             await db.commit()
@@ -360,20 +433,40 @@ async def get_mission_count(user_id):
         return row[0] or 0
 
 
-async def increment_mission_count(user_id):
+async def claim_mission_slot(user_id, daily_limit: int = DAILY_MISSION_LIMIT) -> int | None:
+    """Zählt eine Mission, solange das Tageslimit nicht erreicht ist.
+
+    Prüfen und Hochzählen passieren in einem UPSERT, damit zwei gleichzeitig
+    gestartete Missionen das Limit nicht gemeinsam überschreiten. Gibt den
+    neuen Zählerstand zurück oder None, wenn das Limit schon erreicht ist.
+    """
+    if daily_limit <= 0:
+        return None
     today_start = _berlin_midnight_epoch()
 
     async with db_context() as db:
-        await db.execute(
-            "INSERT OR REPLACE INTO user_daily (user_id, mission_count, last_mission_reset) VALUES "
-            "(?, COALESCE((SELECT mission_count FROM user_daily WHERE user_id = ?), 0) + 1, ?)",
-            (user_id, user_id, today_start),
+        # Upsert statt INSERT OR REPLACE: die übrigen Spalten der Zeile (last_daily,
+        # used_invite, ...) bleiben erhalten. Ein neuer Tag setzt den Zähler direkt
+        # im SQL zurück.
+        cursor = await db.execute(
+            "INSERT INTO user_daily (user_id, mission_count, last_mission_reset) VALUES (?, 1, ?) "
+            "ON CONFLICT(user_id) DO UPDATE SET "
+            "mission_count = CASE "
+            "WHEN COALESCE(user_daily.last_mission_reset, 0) < excluded.last_mission_reset THEN 1 "
+            "ELSE COALESCE(user_daily.mission_count, 0) + 1 END, "
+            "last_mission_reset = excluded.last_mission_reset "
+            "WHERE COALESCE(user_daily.last_mission_reset, 0) < excluded.last_mission_reset "
+            "OR COALESCE(user_daily.mission_count, 0) < ? "
+            "RETURNING mission_count",
+            (user_id, today_start, daily_limit),
         )
+        row = await cursor.fetchone()
         await db.commit()
+        return int(row[0] or 0) if row else None
 
 
 async def get_team(user_id: int) -> list[int]:
-    async with db_context() as db:
+    async with db_read_context() as db:
         cursor = await db.execute("SELECT team FROM user_teams WHERE user_id = ?", (user_id,))
         row = await cursor.fetchone()
         if row and row[0]:
@@ -382,20 +475,24 @@ async def get_team(user_id: int) -> list[int]:
 
 
 async def set_team(user_id: int, team: list[int]) -> None:
+    # team bleibt JSON-Text: Web-Dashboard, Website und /debug-user lesen die Spalte direkt.
     async with db_context() as db:
-        await db.execute("INSERT OR REPLACE INTO user_teams (user_id, team) VALUES (?, ?)", (user_id, json.dumps(team)))
+        await db.execute(
+            "INSERT INTO user_teams (user_id, team) VALUES (?, ?) "
+            "ON CONFLICT(user_id) DO UPDATE SET team = excluded.team",
+            (user_id, json.dumps(team)),
+        )
         await db.commit()
 
 
 async def get_user_karten(user_id: int) -> list[tuple[str, int]]:
-    async with db_context() as db:
-        cursor = await db.execute("SELECT karten_name, anzahl FROM user_karten WHERE user_id = ?", (user_id,))
-        rows = await cursor.fetchall()
+    async with db_read_context() as db:
+        rows = await db.execute_fetchall("SELECT karten_name, anzahl FROM user_karten WHERE user_id = ?", (user_id,))
         return [(normalize_owned_card_name(row[0], cards=karten), int(row[1] or 0)) for row in rows]
 
 
 async def get_last_karte(user_id):
-    async with db_context() as db:
+    async with db_read_context() as db:
         cursor = await db.execute(
             "SELECT karten_name FROM user_karten WHERE user_id = ? ORDER BY rowid DESC LIMIT 1",
             (user_id,),
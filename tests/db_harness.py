@@ -0,0 +1,44 @@
+"""Temporäre SQLite-Datenbank für Tests gegen services/db.py.
+
+Jeder Test bekommt eine eigene Datei in einem Temp-Verzeichnis. Schreib- und
+Lese-Verbindungen werden davor und danach geschlossen, damit keine Verbindung
+auf die Datei eines anderen Tests zeigt.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+
+from services import db as services_db
+
+
+class TempDbTestCase(unittest.TestCase):
+    db_file_name = "test.db"
+
+    def setUp(self) -> None:
+        # Eine von früheren Tests offen gelassene Verbindung zeigt noch auf die
+        # alte Datei; init_db würde sie sonst einfach weiterverwenden.
+        asyncio.run(services_db.close_db())
+        self._tmp = tempfile.TemporaryDirectory()
+        self._old_path = services_db.DB_PATH
+        services_db.DB_PATH = str(Path(self._tmp.name) / self.db_file_name)
+
+    def tearDown(self) -> None:
+        asyncio.run(services_db.close_db())
+        services_db.DB_PATH = self._old_path
+        self._tmp.cleanup()
+
+    def run_with_db(self, coro_factory) -> None:
+        """``coro_factory()`` auf frisch angelegter DB ausführen, danach schließen."""
+
+        async def _wrapper() -> None:
+            await services_db.init_db()
+            try:
+                await coro_factory()
+            finally:
+                await services_db.close_db()
+
+        asyncio.run(_wrapper())
@@ -8,8 +8,10 @@ from unittest.mock import ANY, AsyncMock, MagicMock, patch
 # pyright: reportArgumentType=false, reportAttributeAccessIssue=false, reportOptionalMemberAccess=false, reportOptionalSubscript=false, reportAssignmentType=false
 
 import bot as bot_module
+import reward_spawn_config
 from bot import BattleView, EFFECT_TYPES_WITH_EFFECT_LOGS, FightFeedbackView, MAX_ATTACK_DAMAGE_PER_HIT, MissionBattleView
 from karten import karten
+from services import card_variants as card_variants_module
 from services import user_data as user_data_module
 from services.battle import (
     apply_outgoing_attack_modifier,
@@ -20,8 +22,14 @@ from services.battle import (
     resolve_multi_hit_damage,
     update_battle_log,
 )
-from services.card_pool import ALPHA_PLAYABLE_CARD_NAMES, alpha_playable_cards
-from services.card_variants import build_runtime_card, group_owned_cards_by_base, reward_runtime_cards
+from services.card_pool import ALPHA_PLAYABLE_CARD_NAMES, alpha_playable_cards, canonical_card_name
+from services.card_variants import (
+    build_runtime_card,
+    bump_cards_version,
+    group_owned_cards_by_base,
+    reward_runtime_cards,
+    variant_names_for_base,
+)
 
 
 def _find_card(name: str) -> dict:
@@ -310,6 +318,28 @@ class CardSpecTests(unittest.IsolatedAsyncioTestCase):
         self.assertTrue(bool(alpha.get("admin_only")))
         self.assertFalse(bool(alpha.get("reward_enabled")))
 
+    def test_canonical_card_name_matches_runtime_card_name(self) -> None:
+        for card in karten:
+            for name in [card["name"], *variant_names_for_base(card["name"], cards=karten)]:
+                runtime = build_runtime_card(name)
+                assert runtime is not None
+                self.assertEqual(canonical_card_name(name), runtime["name"])
+                self.assertEqual(canonical_card_name(name.lower()), runtime["name"])
+        self.assertEqual(canonical_card_name("iron man"), "Iron-Man")
+        self.assertEqual(canonical_card_name("Unbekannt"), "Unbekannt")
+
+    def test_card_effective_weights_match_single_card_weights(self) -> None:
+        cards = [{"name": str(card.get("name") or ""), "seltenheit": card.get("seltenheit")} for card in karten]
+        with (
+            patch.dict(reward_spawn_config.CARD_GROUPS, {"test": frozenset({"Hulk"})}),
+            patch.dict(reward_spawn_config.CONTEXT_GROUP_WEIGHTS, {"daily": {"test": {"*": 3.0}}}),
+        ):
+            for context in ("daily", "mission_reward", "kampf", None):
+                self.assertEqual(
+                    reward_spawn_config.card_effective_weights(context, cards),
+                    [reward_spawn_config.card_effective_weight(context, card) for card in cards],
+                )
+
     def test_reward_runtime_cards_exclude_admin_only_variants(self) -> None:
         reward_names = {str(card.get("name") or "") for card in reward_runtime_cards(karten)}
         self.assertIn("Standard_Iron-Man", reward_names)
@@ -324,6 +354,31 @@ class CardSpecTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(int(iron_group.get("total_amount", 0) or 0), 2)
         self.assertEqual(list(iron_group.get("variants") or []), [("Standard_Iron-Man", 1), ("Alpha_Iron-Man", 1)])
 
+    def test_runtime_card_follows_card_changes_after_version_bump(self) -> None:
+        # Groß genug, dass der Index gecacht wird.
+        cards = [
+            {"name": "Testkarte", "bild": "alt.png", "variants": [{"variant_id": "Standard_Testkarte"}]},
+            *karten[:10],
+        ]
+        first = build_runtime_card("Standard_Testkarte", cards=cards)
+        assert first is not None
+        self.assertEqual(first["bild"], "alt.png")
+
+        # Wie card_store.anwenden: Feld an Ort und Stelle ändern, dann Version erhöhen.
+        cards[0]["bild"] = "neu.png"
+        bump_cards_version()
+        updated = build_runtime_card("Standard_Testkarte", cards=cards)
+        assert updated is not None
+        self.assertEqual(updated["bild"], "neu.png")
+
+    def test_single_card_lookups_keep_catalog_index_cached(self) -> None:
+        catalog_index = card_variants_module._name_index(karten)
+        cached_before = len(card_variants_module._NAME_INDEX_CACHE)
+        for card in karten:
+            build_runtime_card(str(card["name"]), cards=[card])
+        self.assertEqual(len(card_variants_module._NAME_INDEX_CACHE), cached_before)
+        self.assertIs(card_variants_module._name_index(karten), catalog_index)
+
     def test_fight_challenge_prompt_shows_challenger_card(self) -> None:
         text = bot_module._fight_challenge_prompt("@Benni", "Alpha_Iron-Man")
         self.assertIn("@Benni", text)
@@ -540,6 +595,27 @@ class BattleUtilityTests(unittest.IsolatedAsyncioTestCase):
         )
         next_view.stop()
 
+    async def test_buff_select_change_card_reuses_card_list_from_picker(self) -> None:
+        selected_name = "Iron-Man"
+        card = await bot_module.get_karte_by_name(selected_name)
+        assert card is not None
+        owned = _owned_unique_cards(3)
+        select = bot_module.BuffTypeSelect(10, selected_name, card, [], user_karten=owned)
+        select._values = ["change_card"]
+
+        interaction = SimpleNamespace(
+            user=SimpleNamespace(id=77),
+            response=SimpleNamespace(send_message=AsyncMock(), edit_message=AsyncMock()),
+        )
+
+        with patch("bot.get_user_karten", new=AsyncMock(return_value=[])) as get_user_karten_mock:
+            await select.callback(interaction)
+
+        get_user_karten_mock.assert_not_awaited()
+        next_view = interaction.response.edit_message.await_args.kwargs["view"]
+        self.assertEqual(next_view.user_karten, owned)
+        next_view.stop()
+
     def test_upgrade_views_include_cancel_button(self) -> None:
         card = {"name": "Iron-Man", "hp": 70, "attacks": [{"name": "Repulsor", "damage": [10, 20]}]}
         views = [
@@ -670,6 +746,60 @@ class BattleUtilityTests(unittest.IsolatedAsyncioTestCase):
             if 'next_view' in locals():
                 next_view.stop()
 
+    def test_fuse_card_options_are_built_once_per_page(self) -> None:
+        grouped_cards = [
+            {"base_name": f"Testheld {index}", "total_amount": 1}
+            for index in range(1, 27)
+        ]
+        view = bot_module.FuseCardSelectView(77, 10, [], mode="browse", grouped_cards=grouped_cards)
+        try:
+            with patch("bot._group_option_label", wraps=bot_module._group_option_label) as label_mock:
+                first_page = view.card_options()
+                view.page = 1
+                self.assertEqual([str(opt.value) for opt in view.card_options()], ["Testheld 26"])
+                view.page = 0
+                self.assertEqual([str(opt.value) for opt in view.card_options()], [str(opt.value) for opt in first_page])
+            self.assertEqual(label_mock.call_count, 1)
+        finally:
+            view.stop()
+
+    def test_admin_user_select_lists_online_members_first_on_large_guilds(self) -> None:
+        members = [
+            SimpleNamespace(
+                id=1000 + index,
+                bot=False,
+                display_name=f"Nutzer {index}",
+                status=bot_module.discord.Status.online if index >= 27 else bot_module.discord.Status.offline,
+            )
+            for index in range(30)
+        ]
+        members.append(SimpleNamespace(id=1, bot=True, display_name="Bot", status=bot_module.discord.Status.online))
+        view = bot_module.AdminUserSelectView(77, SimpleNamespace(members=members))
+        try:
+            values = [str(opt.value) for opt in view.select.options]
+            self.assertEqual(len(values), 25)
+            self.assertEqual(values[:2], ["search", "show_all"])
+            self.assertEqual(values[2:5], ["1027", "1028", "1029"])
+            self.assertEqual(values[5:], [str(1000 + index) for index in range(20)])
+        finally:
+            view.stop()
+
+    def test_give_card_select_reuses_option_pages(self) -> None:
+        first = bot_module.GiveCardSelectView(77, 88)
+        second = bot_module.GiveCardSelectView(77, 88)
+        try:
+            self.assertIs(first.pages, second.pages)
+            self.assertIsNot(first.select.options, second.select.options)
+            self.assertTrue(all(len(page) <= 25 for page in first.pages))
+            self.assertEqual(str(first.pages[-1][-1].value), "infinitydust")
+            bump_cards_version()
+            third = bot_module.GiveCardSelectView(77, 88)
+            third.stop()
+            self.assertIsNot(third.pages, first.pages)
+        finally:
+            first.stop()
+            second.stop()
+
     async def test_fuse_browse_paging_and_back_return_to_root(self) -> None:
         grouped_cards = [
             {"base_name": f"Testheld {index}", "total_amount": 1}
@@ -954,7 +1084,11 @@ class BattleUtilityTests(unittest.IsolatedAsyncioTestCase):
                 ],
             }
         ]
-        with patch.object(user_data_module, "db_context", _fake_db_context), patch.object(user_data_module, "karten", fake_cards):
+        with (
+            patch.object(user_data_module, "db_context", _fake_db_context),
+            patch.object(user_data_module, "db_read_context", _fake_db_context),
+            patch.object(user_data_module, "karten", fake_cards),
+        ):
             result = await user_data_module.get_card_buffs(7, "Testkarte")
 
         self.assertEqual(fake_db.deleted_rows, [(7, "Testkarte", 1)])
@@ -1032,6 +1166,27 @@ class BattleUtilityTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(min_possible, 3)
         self.assertEqual(max_possible, 30)
 
+    def test_multi_hit_force_max_details_without_rolls(self) -> None:
+        cfg = {"hits": 3, "hit_chance": 0.45, "per_hit_damage": [1, 10]}
+        with patch("services.battle.random.randint") as randint_mock:
+            damage, _min_possible, _max_possible, details = resolve_multi_hit_damage(
+                cfg, buff_amount=2, force_max=True, return_details=True
+            )
+        randint_mock.assert_not_called()
+        self.assertEqual(damage, 32)
+        self.assertEqual(details["per_hit_damages"], [10, 10, 10])
+        self.assertEqual(details["total_before_multiplier"], 32)
+
+    def test_multi_hit_details_total_before_multiplier(self) -> None:
+        cfg = {"hits": 2, "hit_chance": 1.0, "per_hit_damage": [5, 5]}
+        damage, _min_possible, _max_possible, details = resolve_multi_hit_damage(
+            cfg, buff_amount=1, attack_multiplier=2.0, return_details=True
+        )
+        self.assertEqual(damage, 22)
+        self.assertEqual(details["per_hit_damages"], [5, 5])
+        self.assertEqual(details["total_before_multiplier"], 11)
+        self.assertEqual(details["total_damage"], 22)
+
     def test_multi_hit_guaranteed_bounds(self) -> None:
         cfg = {"hits": 3, "hit_chance": 0.45, "per_hit_damage": [1, 10]}
         damage, min_possible, max_possible = resolve_multi_hit_damage(cfg, guaranteed_hit=True)
@@ -1122,6 +1277,30 @@ class BattleUtilityTests(unittest.IsolatedAsyncioTestCase):
         self.assertIn("hat jetzt noch **77 Leben**", desc)
         self.assertNotIn("hat jetzt noch **120 Leben**", desc)
 
+    def test_battle_log_keeps_header_and_last_rounds(self) -> None:
+        embed = create_battle_log_embed()
+        header = str(embed.description or "")
+        for round_number in range(1, 7):
+            embed = update_battle_log(
+                embed,
+                "Groot",
+                "BotCard",
+                "Ast",
+                10,
+                False,
+                "Basti",
+                "Bot",
+                round_number,
+                100 - round_number,
+                max_rounds=4,
+            )
+        desc = str(embed.description or "")
+        self.assertTrue(desc.startswith(header))
+        self.assertEqual(desc.count("**Runde "), 4)
+        self.assertNotIn("**Runde 2", desc)
+        self.assertIn("**Runde 3", desc)
+        self.assertIn("**Runde 6", desc)
+
     def test_recent_summary_shows_heal_instead_of_zero_damage(self) -> None:
         class _User:
             def __init__(self, name: str):
@@ -0,0 +1,60 @@
+"""Lese-Verbindungen neben der Schreib-Verbindung (services/db.py).
+
+Reine SELECTs laufen über ``db_read_context()`` auf eigenen read-only-
+Verbindungen. Sie müssen committete Schreibzugriffe sofort sehen und dürfen
+selbst nie schreiben können.
+"""
+
+import asyncio
+import sqlite3
+import unittest
+
+import aiosqlite
+
+from services import db as services_db
+from services.user_data import add_infinitydust, get_infinitydust
+from tests.db_harness import TempDbTestCase
+
+UID = 999_000_201
+
+
+class DbReaderTests(TempDbTestCase):
+    db_file_name = "readers.db"
+
+    def test_reader_sees_committed_write(self) -> None:
+        async def _case() -> None:
+            await add_infinitydust(UID, 7)
+            self.assertEqual(await get_infinitydust(UID), 7)
+            await add_infinitydust(UID, 3)
+            self.assertEqual(await get_infinitydust(UID), 10)
+
+        self.run_with_db(_case)
+
+    def test_reader_is_read_only(self) -> None:
+        async def _case() -> None:
+            async with services_db.db_read_context() as db:
+                with self.assertRaises((aiosqlite.OperationalError, sqlite3.OperationalError)):
+                    await db.execute("INSERT INTO user_infinitydust (user_id, amount) VALUES (?, 1)", (UID,))
+
+        self.run_with_db(_case)
+
+    def test_reader_pool_is_bounded_and_closed(self) -> None:
+        async def _case() -> None:
+            for _ in range(services_db.READER_COUNT * 3):
+                async with services_db.db_read_context() as db:
+                    await db.execute("SELECT 1")
+            self.assertEqual(len(services_db._readers), services_db.READER_COUNT)
+
+        self.run_with_db(_case)
+        self.assertEqual(services_db._readers, [])
+
+    def test_concurrent_first_reads_respect_pool_size(self) -> None:
+        async def _case() -> None:
+            await asyncio.gather(*(services_db.connect_reader() for _ in range(services_db.READER_COUNT * 3)))
+            self.assertEqual(len(services_db._readers), services_db.READER_COUNT)
+
+        self.run_with_db(_case)
+
+
+if __name__ == "__main__":
+    unittest.main()
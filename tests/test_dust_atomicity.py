@@ -13,7 +13,10 @@ import unittest
 from db import close_db, db_context, init_db
 from services.user_data import (
     add_infinitydust,
+    add_karten_amounts,
     add_units,
+    check_and_add_karte,
+    claim_daily_reward,
     get_infinitydust,
     get_units,
     spend_infinitydust,
@@ -23,6 +26,8 @@ from services.user_data import (
 # Hohe, unwahrscheinlich kollidierende Test-IDs.
 DUST_UID = 999_000_101
 UNITS_UID = 999_000_102
+CARD_UID = 999_000_103
+DAILY_UID = 999_000_104
 
 
 async def _reset(table: str, user_id: int) -> None:
@@ -89,6 +94,73 @@ class DustAtomicityTests(unittest.TestCase):
 
         asyncio.run(_run())
 
+    def test_check_and_add_karte_converts_duplicate_to_dust(self) -> None:
+        async def _run() -> None:
+            await init_db()
+            try:
+                await _reset("user_karten", CARD_UID)
+                await _reset("user_infinitydust", CARD_UID)
+                karte = {"name": "Iron-Man"}
+                self.assertTrue(await check_and_add_karte(CARD_UID, karte))
+                self.assertEqual(await get_infinitydust(CARD_UID), 0)
+                self.assertFalse(await check_and_add_karte(CARD_UID, karte))
+                self.assertFalse(await check_and_add_karte(CARD_UID, karte))
+                self.assertEqual(await get_infinitydust(CARD_UID), 2)
+                async with db_context() as db:
+                    cursor = await db.execute(
+                        "SELECT SUM(anzahl) FROM user_karten WHERE user_id = ?", (CARD_UID,)
+                    )
+                    row = await cursor.fetchone()
+                self.assertEqual(int(row[0] or 0), 1)
+            finally:
+                await _reset("user_karten", CARD_UID)
+                await _reset("user_infinitydust", CARD_UID)
+                await close_db()
+
+        asyncio.run(_run())
+
+    def test_add_karten_amounts_adds_all_cards_at_once(self) -> None:
+        async def _run() -> None:
+            await init_db()
+            try:
+                await _reset("user_karten", CARD_UID)
+                added = await add_karten_amounts(CARD_UID, ["Iron-Man", "Hulk", "", "Iron-Man"])
+                self.assertEqual(added, 3)
+                async with db_context() as db:
+                    cursor = await db.execute(
+                        "SELECT karten_name, anzahl FROM user_karten WHERE user_id = ? ORDER BY karten_name",
+                        (CARD_UID,),
+                    )
+                    rows = [tuple(row) for row in await cursor.fetchall()]
+                self.assertEqual(rows, [("Hulk", 1), ("Standard_Iron-Man", 2)])
+            finally:
+                await _reset("user_karten", CARD_UID)
+                await close_db()
+
+        asyncio.run(_run())
+
+    def test_claim_daily_reward_grants_once_per_cooldown(self) -> None:
+        async def _run() -> None:
+            await init_db()
+            try:
+                for table in ("user_daily", "user_karten", "user_infinitydust"):
+                    await _reset(table, DAILY_UID)
+                karte = {"name": "Iron-Man"}
+                results = await asyncio.gather(
+                    *(claim_daily_reward(DAILY_UID, karte, 1_000_000) for _ in range(5))
+                )
+                self.assertEqual(results.count(True), 1)
+                self.assertEqual(results.count(None), 4)
+                self.assertEqual(await get_infinitydust(DAILY_UID), 0)
+                self.assertFalse(await claim_daily_reward(DAILY_UID, karte, 1_000_000 + 86400))
+                self.assertEqual(await get_infinitydust(DAILY_UID), 1)
+            finally:
+                for table in ("user_daily", "user_karten", "user_infinitydust"):
+                    await _reset(table, DAILY_UID)
+                await close_db()
+
+        asyncio.run(_run())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,99 @@
+"""Tageszähler für Missionen in ``user_daily`` (services/user_data.py)."""
+
+import asyncio
+import unittest
+
+from battle_flow_config import DAILY_MISSION_LIMIT
+from services import db as services_db
+from services import user_data
+from tests.db_harness import TempDbTestCase
+
+UID = 999_000_301
+
+
+async def _daily_row(user_id: int):
+    async with services_db.db_context() as db:
+        cursor = await db.execute(
+            "SELECT last_daily, mission_count, last_mission_reset FROM user_daily WHERE user_id = ?",
+            (user_id,),
+        )
+        return await cursor.fetchone()
+
+
+class MissionCountTests(TempDbTestCase):
+    db_file_name = "missions.db"
+
+    def test_claim_keeps_other_daily_columns(self) -> None:
+        async def _case() -> None:
+            async with services_db.db_context() as db:
+                await db.execute(
+                    "INSERT INTO user_daily (user_id, last_daily, mission_count, last_mission_reset) "
+                    "VALUES (?, 12345, 0, ?)",
+                    (UID, user_data._berlin_midnight_epoch()),
+                )
+                await db.commit()
+            self.assertEqual(await user_data.claim_mission_slot(UID), 1)
+            row = await _daily_row(UID)
+            self.assertEqual(row[0], 12345)
+            self.assertEqual(row[1], 1)
+
+        self.run_with_db(_case)
+
+    def test_daily_reset_keeps_other_daily_columns(self) -> None:
+        async def _case() -> None:
+            async with services_db.db_context() as db:
+                await db.execute(
+                    "INSERT INTO user_daily (user_id, last_daily, mission_count, last_mission_reset, used_invite) "
+                    "VALUES (?, 12345, 2, ?, 1)",
+                    (UID, user_data._berlin_midnight_epoch() - 86400),
+                )
+                await db.commit()
+            self.assertEqual(await user_data.get_mission_count(UID), 0)
+            row = await _daily_row(UID)
+            self.assertEqual(row[0], 12345)
+            self.assertEqual(row[2], user_data._berlin_midnight_epoch())
+
+        self.run_with_db(_case)
+
+    def test_claim_mission_slot_stops_at_daily_limit(self) -> None:
+        async def _case() -> None:
+            self.assertEqual(await user_data.claim_mission_slot(UID, daily_limit=2), 1)
+            self.assertEqual(await user_data.claim_mission_slot(UID, daily_limit=2), 2)
+            self.assertIsNone(await user_data.claim_mission_slot(UID, daily_limit=2))
+            self.assertEqual(await user_data.get_mission_count(UID), 2)
+
+        self.run_with_db(_case)
+
+    def test_concurrent_claims_never_exceed_limit(self) -> None:
+        async def _case() -> None:
+            results = await asyncio.gather(*(user_data.claim_mission_slot(UID, daily_limit=2) for _ in range(5)))
+            self.assertEqual(sorted(r for r in results if r is not None), [1, 2])
+            self.assertEqual(results.count(None), 3)
+
+        self.run_with_db(_case)
+
+    def test_claim_on_new_day_starts_at_one(self) -> None:
+        async def _case() -> None:
+            async with services_db.db_context() as db:
+                await db.execute(
+                    "INSERT INTO user_daily (user_id, mission_count, last_mission_reset) VALUES (?, 2, ?)",
+                    (UID, user_data._berlin_midnight_epoch() - 86400),
+                )
+                await db.commit()
+            self.assertEqual(await user_data.claim_mission_slot(UID), 1)
+            row = await _daily_row(UID)
+            self.assertEqual(row[2], user_data._berlin_midnight_epoch())
+
+        self.run_with_db(_case)
+
+    def test_default_limit_is_daily_mission_limit(self) -> None:
+        async def _case() -> None:
+            for expected in range(1, DAILY_MISSION_LIMIT + 1):
+                self.assertEqual(await user_data.claim_mission_slot(UID), expected)
+            self.assertIsNone(await user_data.claim_mission_slot(UID))
+
+        self.run_with_db(_case)
+
+
+if __name__ == "__main__":
+    unittest.main()